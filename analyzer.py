@@ -315,7 +315,7 @@ class ResumeAnalyzerCLI:
         
         # Save JSON
         json_path = output_path / "batch_analysis.json"
-        self.json_reporter.generate_batch_report(ranked_resumes, str(json_path))
+        self.json_reporter.generate_batch_report_stream(ranked_resumes, str(json_path))
         
         # Save CSV ranking
         csv_path = output_path / "candidate_rankings.csv"
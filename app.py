@@ -292,7 +292,7 @@ def display_analysis_results(results: dict):
     
     with col1:
         # Score card
-        score = score_result['final_score']
+        score = score_result['total_score']
         grade = score_result['grade']
         status = score_result['status']
         
@@ -485,7 +485,7 @@ def batch_analysis_tab():
                 ranking_data.append({
                     'Candidate': result['resume_data'].get('name', 'N/A'),
                     'Filename': result['filename'],
-                    'ATS Score': result['score_result']['final_score'],
+                    'ATS Score': result['score_result']['total_score'],
                     'Grade': result['score_result']['grade'],
                     'Experience (Years)': sum([exp.get('duration_months', 0) for exp in result['resume_data'].get('experience', [])]) / 12,
                     'Skills Count': len(result['resume_data'].get('technical_skills', [])),
@@ -2,19 +2,38 @@
 Optimizer Module
 Generates actionable feedback and optimization suggestions for resumes
 """
-from typing import List, Dict
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
+import copy
+import json
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Quantified achievements (percentages, multipliers, dollar amounts, ...)
+_METRIC_PATTERN = re.compile(r'\d+%|\d+x|\$\d+|saved \d+|increased \d+', re.IGNORECASE)
+
+_ADVANCED_DEGREES = frozenset({'Phd', 'Doctorate', 'Master', 'Mba'})
+_WEAK_VERBS = ('responsible for', 'worked on', 'helped with', 'assisted in')
+_STRONG_VERBS = ('Led', 'Developed', 'Implemented', 'Achieved', 'Optimized', 'Designed')
+
 
 class ResumeOptimizer:
     """
     Analyze resumes and provide optimization suggestions
     """
     
-    def __init__(self):
+    def __init__(self, cache_size: int = 256):
+        """
+        Initialize optimizer
+        
+        Args:
+            cache_size: Maximum number of feedback results to memoize (0 disables)
+        """
+        self.cache_size = cache_size
+        self._feedback_cache = OrderedDict()
+        
         # High-value skills by domain
         self.trending_skills = {
             'software': ['python', 'java', 'javascript', 'react', 'aws', 'docker', 'kubernetes'],
@@ -36,6 +55,12 @@ class ResumeOptimizer:
         Returns:
             Dictionary with suggestions and improvements
         """
+        cache_key = self._make_cache_key(resume_data, jd_text, ats_score) if self.cache_size > 0 else None
+        if cache_key is not None and cache_key in self._feedback_cache:
+            self._feedback_cache.move_to_end(cache_key)
+            logger.info("Using cached optimization feedback")
+            return copy.deepcopy(self._feedback_cache[cache_key])
+        
         logger.info("Generating optimization feedback...")
         
         feedback = {
@@ -70,8 +95,23 @@ class ResumeOptimizer:
         logger.info(f"Feedback generated: {len(feedback['improvements'])} improvements, "
                    f"{len(feedback['suggestions'])} suggestions")
         
+        if cache_key is not None:
+            self._feedback_cache[cache_key] = copy.deepcopy(feedback)
+            if len(self._feedback_cache) > self.cache_size:
+                self._feedback_cache.popitem(last=False)
+        
         return feedback
     
+    @staticmethod
+    def _make_cache_key(resume_data: Dict, jd_text: str, ats_score: Dict) -> Optional[Tuple[int, str, int]]:
+        """Build a hashable cache key, or None if the inputs cannot be serialized"""
+        try:
+            resume_hash = hash(json.dumps(resume_data, sort_keys=True, default=str))
+            ats_hash = hash(json.dumps(ats_score, sort_keys=True, default=str))
+        except (TypeError, ValueError):
+            return None
+        return resume_hash, jd_text or '', ats_hash
+    
     def _get_overall_rating(self, resume_data: Dict, ats_score: Dict) -> str:
         """Get overall resume rating"""
         if ats_score and 'total_score' in ats_score:
@@ -196,14 +236,8 @@ class ResumeOptimizer:
         
         # Check experience descriptions for quantifiable achievements
         experiences = resume_data.get('experience', [])
-        has_metrics = False
-        
-        for exp in experiences:
-            desc = exp.get('description', '')
-            # Look for numbers/metrics
-            if re.search(r'\d+%|\d+x|\$\d+|saved \d+|increased \d+', desc, re.IGNORECASE):
-                has_metrics = True
-                break
+        all_descriptions = '\n'.join(exp.get('description', '') for exp in experiences)
+        has_metrics = bool(_METRIC_PATTERN.search(all_descriptions))
         
         if not has_metrics and experiences:
             suggestions.append(
@@ -212,15 +246,12 @@ class ResumeOptimizer:
             )
         
         # Check for action verbs
-        weak_verbs = ['responsible for', 'worked on', 'helped with', 'assisted in']
-        strong_verbs = ['Led', 'Developed', 'Implemented', 'Achieved', 'Optimized', 'Designed']
-        
         for exp in experiences:
             desc = exp.get('description', '').lower()
-            if any(verb in desc for verb in weak_verbs):
+            if any(verb in desc for verb in _WEAK_VERBS):
                 suggestions.append(
                     f"💪 Use strong action verbs instead of passive phrases "
-                    f"(Try: {', '.join(strong_verbs[:3])}...)"
+                    f"(Try: {', '.join(_STRONG_VERBS[:3])}...)"
                 )
                 break
         
@@ -312,7 +343,7 @@ class ResumeOptimizer:
         
         # Education level
         edu_level = resume_data.get('summary', {}).get('education_level', '')
-        if edu_level in ['Phd', 'Doctorate', 'Master', 'Mba']:
+        if edu_level in _ADVANCED_DEGREES:
             strengths.append(f"✅ Advanced degree ({edu_level})")
         
         # Projects
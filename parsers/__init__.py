@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Dict, Optional
 import logging
 
+from .parse_result import ParseResult
 from .pdf_parser import PDFParser
 from .docx_parser import DOCXParser
 from .txt_parser import TXTParser
@@ -30,7 +31,7 @@ class ResumeParser:
             '.txt': self.txt_parser
         }
     
-    def parse(self, file_path: str) -> Dict[str, any]:
+    def parse(self, file_path: str) -> ParseResult:
         """
         Parse resume file and extract content
         
@@ -38,7 +39,7 @@ class ResumeParser:
             file_path: Path to resume file
             
         Returns:
-            Dictionary containing extracted data
+            ParseResult containing extracted data (supports dict-style access)
             
         Raises:
             ValueError: If file format is not supported
@@ -58,8 +59,8 @@ class ResumeParser:
         
         try:
             result = parser.parse(str(file_path))
-            result['format'] = extension
-            result['filename'] = file_path.name
+            result.format = extension
+            result.filename = file_path.name
             return result
         except Exception as e:
             logger.error(f"Failed to parse {file_path}: {str(e)}")
@@ -95,8 +96,7 @@ class ResumeParser:
         Returns:
             Extracted text as string
         """
-        result = self.parse(file_path)
-        return result.get('text', '')
+        return self.parse(file_path).text
     
     @staticmethod
     def get_supported_formats() -> list:
@@ -109,4 +109,4 @@ class ResumeParser:
         return ['.pdf', '.docx', '.doc', '.txt']
 
 
-__all__ = ['ResumeParser', 'PDFParser', 'DOCXParser', 'TXTParser']
+__all__ = ['ResumeParser', 'ParseResult', 'PDFParser', 'DOCXParser', 'TXTParser']
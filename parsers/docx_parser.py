@@ -4,9 +4,10 @@ Extracts text and tables from DOCX resumes using python-docx
 """
 from docx import Document
 from pathlib import Path
-from typing import Dict, List
 import logging
 
+from .parse_result import ParseResult
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,7 +17,7 @@ class DOCXParser:
     def __init__(self):
         self.supported_extensions = ['.docx', '.doc']
     
-    def parse(self, file_path: str) -> Dict[str, any]:
+    def parse(self, file_path: str) -> ParseResult:
         """
         Parse DOCX file and extract text, tables, and metadata
         
@@ -24,20 +25,14 @@ class DOCXParser:
             file_path: Path to DOCX file
             
         Returns:
-            Dictionary containing extracted text, tables, and metadata
+            ParseResult containing extracted text, tables, and metadata
         """
         try:
             file_path = Path(file_path)
             if not file_path.exists():
                 raise FileNotFoundError(f"File not found: {file_path}")
             
-            result = {
-                'text': '',
-                'tables': [],
-                'paragraphs': 0,
-                'metadata': {},
-                'file_path': str(file_path)
-            }
+            result = ParseResult(file_path=str(file_path))
             
             doc = Document(file_path)
             
@@ -47,8 +42,8 @@ class DOCXParser:
                 if para.text.strip():
                     paragraphs.append(para.text)
             
-            result['text'] = '\n'.join(paragraphs)
-            result['paragraphs'] = len(paragraphs)
+            result.text = '\n'.join(paragraphs)
+            result.paragraphs = len(paragraphs)
             
             # Extract tables
             tables_data = []
@@ -62,11 +57,11 @@ class DOCXParser:
                     'data': table_data
                 })
             
-            result['tables'] = tables_data
+            result.tables = tables_data
             
             # Extract metadata
             core_properties = doc.core_properties
-            result['metadata'] = {
+            result.metadata = {
                 'author': core_properties.author,
                 'created': str(core_properties.created) if core_properties.created else None,
                 'modified': str(core_properties.modified) if core_properties.modified else None,
@@ -74,7 +69,7 @@ class DOCXParser:
                 'subject': core_properties.subject
             }
             
-            logger.info(f"Successfully parsed DOCX: {file_path.name} ({result['paragraphs']} paragraphs)")
+            logger.info(f"Successfully parsed DOCX: {file_path.name} ({result.paragraphs} paragraphs)")
             return result
             
         except Exception as e:
@@ -91,8 +86,7 @@ class DOCXParser:
         Returns:
             Extracted text as string
         """
-        result = self.parse(file_path)
-        return result['text']
+        return self.parse(file_path).text
     
     def is_valid_docx(self, file_path: str) -> bool:
         """
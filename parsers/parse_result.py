@@ -0,0 +1,60 @@
+"""
+Parse Result Module
+Slotted container returned by all resume parsers
+"""
+import sys
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional
+
+# dataclass(slots=True) needs Python 3.10; older interpreters get a plain dataclass
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class ParseResult:
+    """
+    Result of parsing a single resume file
+
+    Supports dict-style access (``result['text']``, ``result.get('pages')``)
+    so existing callers keep working unchanged.
+    """
+
+    text: str = ''
+    file_path: str = ''
+    tables: List[Dict] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    pages: int = 0
+    paragraphs: int = 0
+    lines: int = 0
+    encoding: Optional[str] = None
+    format: Optional[str] = None
+    filename: Optional[str] = None
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in _FIELD_NAMES
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style lookup with default"""
+        return getattr(self, key) if key in self else default
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a plain dictionary
+
+        Returns:
+            Dictionary with one entry per field
+        """
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+_FIELD_NAMES = frozenset(f.name for f in fields(ParseResult))
@@ -4,20 +4,47 @@ Extracts text and tables from PDF resumes using pdfplumber
 """
 import pdfplumber
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import List, Optional, Tuple
 import logging
 
+from .parse_result import ParseResult
+
 logger = logging.getLogger(__name__)
 
 
+def _extract_page(page) -> Tuple[Optional[str], List]:
+    """Extract text and tables from a single pdfplumber page"""
+    return page.extract_text(), page.extract_tables()
+
+
+def _extract_page_range(file_path: Path, start: int, stop: int) -> List[Tuple[Optional[str], List]]:
+    """Extract pages [start, stop) in a worker process with its own document handle"""
+    with pdfplumber.open(file_path) as pdf:
+        return [_extract_page(pdf.pages[i]) for i in range(start, stop)]
+
+
 class PDFParser:
     """Parse PDF files and extract text content"""
     
-    def __init__(self):
+    def __init__(self, max_workers: int = 1, parallel_page_threshold: int = 4):
+        """
+        Initialize PDF parser
+        
+        Args:
+            max_workers: Maximum worker processes for page extraction (1, the
+                default, extracts serially; pdfminer is pure Python, so only
+                separate processes on separate cores speed it up, and each
+                one re-parses the document)
+            parallel_page_threshold: Documents with more pages than this are
+                extracted in parallel when max_workers > 1
+        """
         self.supported_extensions = ['.pdf']
+        self.max_workers = max_workers
+        self.parallel_page_threshold = parallel_page_threshold
     
-    def parse(self, file_path: str) -> Dict[str, any]:
+    def parse(self, file_path: str) -> ParseResult:
         """
         Parse PDF file and extract text, tables, and metadata
         
@@ -25,7 +52,7 @@ class PDFParser:
             file_path: Path to PDF file
             
         Returns:
-            Dictionary containing extracted text, tables, and metadata
+            ParseResult containing extracted text, tables, and metadata
         """
         try:
             file_path = Path(file_path)
@@ -35,46 +62,64 @@ class PDFParser:
             if file_path.suffix.lower() not in self.supported_extensions:
                 raise ValueError(f"Unsupported file type: {file_path.suffix}")
             
-            result = {
-                'text': '',
-                'tables': [],
-                'pages': 0,
-                'metadata': {},
-                'file_path': str(file_path)
-            }
+            result = ParseResult(file_path=str(file_path))
             
             with pdfplumber.open(file_path) as pdf:
-                result['pages'] = len(pdf.pages)
-                result['metadata'] = pdf.metadata or {}
+                result.pages = len(pdf.pages)
+                result.metadata = pdf.metadata or {}
                 
-                all_text = []
-                all_tables = []
-                
-                for page_num, page in enumerate(pdf.pages, 1):
-                    # Extract text
-                    page_text = page.extract_text()
-                    if page_text:
-                        all_text.append(page_text)
-                    
-                    # Extract tables
-                    tables = page.extract_tables()
-                    if tables:
-                        for table in tables:
-                            all_tables.append({
-                                'page': page_num,
-                                'data': table
-                            })
+                parallel = result.pages > self.parallel_page_threshold and self.max_workers > 1
+                if not parallel:
+                    page_results = [_extract_page(page) for page in pdf.pages]
+            
+            # Workers open their own handles, so the main one is closed first
+            if parallel:
+                page_results = self._extract_pages_parallel(file_path, result.pages)
+            
+            all_text = []
+            all_tables = []
+            
+            for page_num, (page_text, tables) in enumerate(page_results, 1):
+                if page_text:
+                    all_text.append(page_text)
                 
-                result['text'] = '\n'.join(all_text)
-                result['tables'] = all_tables
+                for table in tables or []:
+                    all_tables.append({
+                        'page': page_num,
+                        'data': table
+                    })
+            
+            result.text = '\n'.join(all_text)
+            result.tables = all_tables
             
-            logger.info(f"Successfully parsed PDF: {file_path.name} ({result['pages']} pages)")
+            logger.info(f"Successfully parsed PDF: {file_path.name} ({result.pages} pages)")
             return result
             
         except Exception as e:
             logger.error(f"Error parsing PDF {file_path}: {str(e)}")
             raise
     
+    def _extract_pages_parallel(self, file_path: Path, num_pages: int) -> List[Tuple[Optional[str], List]]:
+        """
+        Extract all pages using a process pool, preserving page order
+        
+        Args:
+            file_path: Path to PDF file
+            num_pages: Total number of pages
+            
+        Returns:
+            List of (text, tables) tuples in page order
+        """
+        workers = min(self.max_workers, num_pages)
+        chunk_size = -(-num_pages // workers)
+        ranges = [(start, min(start + chunk_size, num_pages))
+                  for start in range(0, num_pages, chunk_size)]
+        
+        starts, stops = zip(*ranges)
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            chunks = executor.map(_extract_page_range, [file_path] * len(ranges), starts, stops)
+            return [page for chunk in chunks for page in chunk]
+    
     def extract_text_only(self, file_path: str) -> str:
         """
         Quick extraction of text only (no tables)
@@ -85,8 +130,7 @@ class PDFParser:
         Returns:
             Extracted text as string
         """
-        result = self.parse(file_path)
-        return result['text']
+        return self.parse(file_path).text
     
     def is_valid_pdf(self, file_path: str) -> bool:
         """
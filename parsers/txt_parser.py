@@ -3,9 +3,10 @@ TXT Parser Module
 Extracts text from plain text resumes
 """
 from pathlib import Path
-from typing import Dict
 import logging
 
+from .parse_result import ParseResult
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,7 +17,7 @@ class TXTParser:
         self.supported_extensions = ['.txt']
         self.encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
     
-    def parse(self, file_path: str) -> Dict[str, any]:
+    def parse(self, file_path: str) -> ParseResult:
         """
         Parse TXT file and extract text
         
@@ -24,19 +25,14 @@ class TXTParser:
             file_path: Path to TXT file
             
         Returns:
-            Dictionary containing extracted text and metadata
+            ParseResult containing extracted text and metadata
         """
         try:
             file_path = Path(file_path)
             if not file_path.exists():
                 raise FileNotFoundError(f"File not found: {file_path}")
             
-            result = {
-                'text': '',
-                'lines': 0,
-                'encoding': None,
-                'file_path': str(file_path)
-            }
+            result = ParseResult(file_path=str(file_path))
             
             # Try different encodings
             text = None
@@ -44,7 +40,7 @@ class TXTParser:
                 try:
                     with open(file_path, 'r', encoding=encoding) as f:
                         text = f.read()
-                    result['encoding'] = encoding
+                    result.encoding = encoding
                     break
                 except UnicodeDecodeError:
                     continue
@@ -52,10 +48,10 @@ class TXTParser:
             if text is None:
                 raise ValueError(f"Could not decode file with any supported encoding")
             
-            result['text'] = text
-            result['lines'] = len(text.split('\n'))
+            result.text = text
+            result.lines = len(text.split('\n'))
             
-            logger.info(f"Successfully parsed TXT: {file_path.name} ({result['lines']} lines)")
+            logger.info(f"Successfully parsed TXT: {file_path.name} ({result.lines} lines)")
             return result
             
         except Exception as e:
@@ -72,5 +68,4 @@ class TXTParser:
         Returns:
             Extracted text as string
         """
-        result = self.parse(file_path)
-        return result['text']
+        return self.parse(file_path).text
@@ -2,11 +2,55 @@
 Ranker Module
 Multi-resume ranking with ensemble scoring
 """
-from typing import List, Dict
+from collections import OrderedDict
+from typing import List, Dict, NamedTuple, Optional, Tuple
+import hashlib
+import json
+import numpy as np
+import os
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Education level -> integer code, keyed case-insensitively and including
+# common abbreviations; unknown levels map to the last table slot
+_EDU_LEVEL_CODES = {k.casefold(): v for k, v in {
+    'Phd': 0, 'Ph.D': 0, 'Doctorate': 0,
+    'Master': 1, 'Masters': 1, 'M.S': 1, 'M.Tech': 1, 'MTech': 1, 'Mba': 1, 'M.B.A': 1,
+    'Bachelor': 2, 'Bachelors': 2, 'B.S': 2, 'B.Tech': 2, 'BTech': 2, 'B.E': 2, 'B.A': 2,
+    'Associate': 3,
+    'Diploma': 4
+}.items()}
+_EDU_SCORE_TABLE = np.array([100, 85, 70, 50, 40, 30], dtype=float)
+_UNKNOWN_EDU_CODE = len(_EDU_SCORE_TABLE) - 1
+
+# Keys written back by rank_resumes; excluded from content hashes
+_RANKING_KEYS = frozenset({'composite_score', 'original_index', 'rank'})
+
+
+class _ResumeView(NamedTuple):
+    """Flat view of the resume fields used when comparing candidates"""
+    name: str
+    score: float
+    rank: int
+    skills_count: int
+    experience_years: float
+    education_level: str
+
+
+def _resume_view(resume: Dict, default_name: str) -> _ResumeView:
+    """Resolve nested resume fields once into a flat view"""
+    extracted = resume.get('extracted_data', {})
+    summary = extracted.get('summary', {})
+    return _ResumeView(
+        name=extracted.get('contact', {}).get('name', default_name),
+        score=resume.get('composite_score', 0),
+        rank=resume.get('rank', 0),
+        skills_count=extracted.get('skills', {}).get('total_count', 0),
+        experience_years=summary.get('total_experience_years', 0),
+        education_level=summary.get('education_level', 'Not specified')
+    )
+
 
 class ResumeRanker:
     """
@@ -14,13 +58,33 @@ class ResumeRanker:
     Weighting: Skills 40%, Experience 30%, Education 20%, Projects 10%
     """
     
-    def __init__(self):
+    def __init__(self, cache_size: int = 0, cache_dir: Optional[str] = None):
+        """
+        Initialize ranker
+        
+        Args:
+            cache_size: Number of composite scores to memoize by resume content
+                hash (0 disables the in-memory cache)
+            cache_dir: Optional directory for a persistent score cache
+                (e.g. ~/.cache/resumeai/scores), requires diskcache
+        """
         self.weights = {
             'skills': 0.40,
             'experience': 0.30,
             'education': 0.20,
             'projects': 0.10
         }
+        
+        self.cache_size = cache_size
+        self._score_cache = OrderedDict()
+        self._disk_cache = None
+        if cache_dir:
+            try:
+                import diskcache
+                self._disk_cache = diskcache.Cache(os.path.expanduser(cache_dir))
+                logger.info(f"Using persistent score cache at {cache_dir}")
+            except Exception as e:
+                logger.warning(f"Could not open score cache: {e}. Using in-memory cache only.")
     
     def rank_resumes(self, resumes_data: List[Dict], jd_text: str = None) -> List[Dict]:
         """
@@ -36,12 +100,11 @@ class ResumeRanker:
         logger.info(f"Ranking {len(resumes_data)} resumes...")
         
         # Calculate composite scores
-        for i, resume in enumerate(resumes_data):
-            resume['composite_score'] = self._calculate_composite_score(resume)
-            resume['original_index'] = i
+        composite_scores = self._score_resumes(resumes_data)
         
-        # Sort by composite score
-        ranked = sorted(resumes_data, key=lambda x: x['composite_score'], reverse=True)
+        # Sort by composite score (stable, so ties keep input order)
+        order = np.argsort(-composite_scores, kind='stable')
+        ranked = [resumes_data[i] for i in order]
         
         # Add rank numbers
         for rank, resume in enumerate(ranked, 1):
@@ -50,6 +113,55 @@ class ResumeRanker:
         logger.info(f"Ranking completed. Top score: {ranked[0]['composite_score']:.2f}")
         return ranked
     
+    def rank_top_k(self, resumes_data: List[Dict], top_k: int = 5) -> List[Dict]:
+        """
+        Rank only the top K resumes without fully sorting the batch
+        
+        Produces the same first K entries as rank_resumes (ties keep input
+        order) using an O(N) selection followed by a sort of just K scores.
+        
+        Args:
+            resumes_data: List of dictionaries containing resume data and scores
+            top_k: Number of top candidates to return
+            
+        Returns:
+            Sorted list of the top K resumes with rankings
+        """
+        logger.info(f"Selecting top {top_k} of {len(resumes_data)} resumes...")
+        
+        composite_scores = self._score_resumes(resumes_data)
+        num_resumes = len(composite_scores)
+        top_k = max(0, min(top_k, num_resumes))
+        
+        if top_k == 0:
+            return []
+        
+        if top_k == num_resumes:
+            top_indices = np.arange(num_resumes)
+        else:
+            # Everything strictly above the K-th largest score, then the
+            # earliest resumes tied with it
+            kth_score = np.partition(composite_scores, num_resumes - top_k)[num_resumes - top_k]
+            above = np.flatnonzero(composite_scores > kth_score)
+            ties = np.flatnonzero(composite_scores == kth_score)[:top_k - len(above)]
+            top_indices = np.concatenate([above, ties])
+        
+        order = top_indices[np.argsort(-composite_scores[top_indices], kind='stable')]
+        ranked = [resumes_data[i] for i in order]
+        
+        for rank, resume in enumerate(ranked, 1):
+            resume['rank'] = rank
+        
+        return ranked
+    
+    def _score_resumes(self, resumes_data: List[Dict]) -> np.ndarray:
+        """Compute composite scores and record them on each resume"""
+        composite_scores = self._calculate_composite_scores(resumes_data)
+        for i, (resume, score) in enumerate(zip(resumes_data, composite_scores.tolist())):
+            resume['composite_score'] = score
+            resume['original_index'] = i
+        return composite_scores
+    
     def _calculate_composite_score(self, resume_data: Dict) -> float:
         """
         Calculate composite score based on multiple factors
@@ -60,54 +172,136 @@ class ResumeRanker:
         Returns:
             Composite score (0-100)
         """
-        scores = {
-            'skills': 0,
-            'experience': 0,
-            'education': 0,
-            'projects': 0
-        }
+        return float(self._calculate_composite_scores([resume_data])[0])
+    
+    def _calculate_composite_scores(self, resumes_data: List[Dict]) -> np.ndarray:
+        """
+        Calculate composite scores for a batch of resumes, reusing cached scores
         
-        # If ATS score is available, use it
-        if 'ats_score' in resume_data and 'breakdown' in resume_data['ats_score']:
-            breakdown = resume_data['ats_score']['breakdown']
-            scores['skills'] = breakdown.get('skills_match', 0)
-            scores['experience'] = breakdown.get('experience_relevance', 0)
-            # Use total score components
-            if 'total_score' in resume_data['ats_score']:
-                return resume_data['ats_score']['total_score']
-        
-        # Otherwise, calculate from extracted data
-        extracted = resume_data.get('extracted_data', resume_data)
-        
-        # Skills score
-        skills_data = extracted.get('skills', {})
-        total_skills = skills_data.get('total_count', 0)
-        scores['skills'] = min(100, total_skills * 5)  # 20+ skills = 100
-        
-        # Experience score
-        experience_data = extracted.get('experience', [])
-        total_years = sum(exp.get('duration_years', 0) for exp in experience_data)
-        scores['experience'] = min(100, total_years * 20)  # 5+ years = 100
-        
-        # Education score
-        education_level = extracted.get('summary', {}).get('education_level', 'Not specified')
-        edu_scores = {
-            'Phd': 100, 'Doctorate': 100,
-            'Master': 85, 'Mba': 85,
-            'Bachelor': 70,
-            'Associate': 50,
-            'Diploma': 40
-        }
-        scores['education'] = edu_scores.get(education_level, 30)
+        Args:
+            resumes_data: List of resume data dictionaries
+            
+        Returns:
+            Array of composite scores (0-100), one per resume
+        """
+        if self.cache_size <= 0 and self._disk_cache is None:
+            return self._compute_composite_scores(resumes_data)
+        
+        keys = [self._content_key(resume_data) for resume_data in resumes_data]
+        scores = np.empty(len(resumes_data), dtype=float)
+        missing = []
         
-        # Projects score
-        projects = extracted.get('projects', [])
-        scores['projects'] = min(100, len(projects) * 25)  # 4+ projects = 100
+        for i, key in enumerate(keys):
+            cached = self._get_cached_score(key)
+            if cached is None:
+                missing.append(i)
+            else:
+                scores[i] = cached
+        
+        if missing:
+            computed = self._compute_composite_scores([resumes_data[i] for i in missing])
+            scores[missing] = computed
+            for i, score in zip(missing, computed.tolist()):
+                self._store_cached_score(keys[i], score)
+        
+        return scores
+    
+    def _compute_composite_scores(self, resumes_data: List[Dict]) -> np.ndarray:
+        """
+        Calculate composite scores for a batch of resumes in one vectorized pass
+        
+        Args:
+            resumes_data: List of resume data dictionaries
+            
+        Returns:
+            Array of composite scores (0-100), one per resume
+        """
+        features = self._gather_features(resumes_data)
+        ats_totals, has_ats, skills_raw, years_raw, projects_raw, edu_codes = features
+        
+        skills = np.minimum(np.asarray(skills_raw, dtype=float) * 5, 100)  # 20+ skills = 100
+        experience = np.minimum(np.asarray(years_raw, dtype=float) * 20, 100)  # 5+ years = 100
+        education = _EDU_SCORE_TABLE[np.asarray(edu_codes, dtype=np.intp)]
+        projects = np.minimum(np.asarray(projects_raw, dtype=float) * 25, 100)  # 4+ projects = 100
         
         # Calculate weighted composite
-        composite = sum(scores[key] * self.weights[key] for key in scores)
+        composite = np.round(
+            skills * self.weights['skills'] +
+            experience * self.weights['experience'] +
+            education * self.weights['education'] +
+            projects * self.weights['projects'],
+            2
+        )
+        
+        return np.where(np.asarray(has_ats, dtype=bool), np.asarray(ats_totals, dtype=float), composite)
+    
+    def _content_key(self, resume_data: Dict) -> bytes:
+        """Hash resume content (and weights) into a compact cache key"""
+        content = {k: v for k, v in resume_data.items() if k not in _RANKING_KEYS}
+        payload = json.dumps([self.weights, content], sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+    
+    def _get_cached_score(self, key: bytes) -> Optional[float]:
+        """Look up a score in the in-memory cache, then the persistent cache"""
+        if key in self._score_cache:
+            self._score_cache.move_to_end(key)
+            return self._score_cache[key]
+        
+        if self._disk_cache is not None:
+            score = self._disk_cache.get(key)
+            if score is not None:
+                self._store_cached_score(key, score, persist=False)
+                return score
         
-        return round(composite, 2)
+        return None
+    
+    def _store_cached_score(self, key: bytes, score: float, persist: bool = True):
+        """Store a score in the in-memory cache and optionally the persistent cache"""
+        if self.cache_size > 0:
+            self._score_cache[key] = score
+            if len(self._score_cache) > self.cache_size:
+                self._score_cache.popitem(last=False)
+        
+        if persist and self._disk_cache is not None:
+            self._disk_cache.set(key, score)
+    
+    @staticmethod
+    def _gather_features(resumes_data: List[Dict]) -> Tuple[List, ...]:
+        """
+        Collect raw scoring features for each resume
+        
+        Args:
+            resumes_data: List of resume data dictionaries
+            
+        Returns:
+            Tuple of parallel lists: (ats_totals, has_ats, skills, years, projects, edu_codes)
+        """
+        ats_totals = []
+        has_ats = []
+        skills_raw = []
+        years_raw = []
+        projects_raw = []
+        edu_codes = []
+        
+        for resume_data in resumes_data:
+            # If ATS score is available, use it
+            ats_score = resume_data.get('ats_score')
+            if ats_score and 'breakdown' in ats_score and 'total_score' in ats_score:
+                has_ats.append(True)
+                ats_totals.append(ats_score['total_score'])
+            else:
+                has_ats.append(False)
+                ats_totals.append(0.0)
+            
+            # Otherwise, calculate from extracted data
+            extracted = resume_data.get('extracted_data', resume_data)
+            skills_raw.append(extracted.get('skills', {}).get('total_count', 0))
+            years_raw.append(sum(exp.get('duration_years', 0) for exp in extracted.get('experience', [])))
+            projects_raw.append(len(extracted.get('projects', [])))
+            education_level = extracted.get('summary', {}).get('education_level') or 'Not specified'
+            edu_codes.append(_EDU_LEVEL_CODES.get(education_level.casefold(), _UNKNOWN_EDU_CODE))
+        
+        return ats_totals, has_ats, skills_raw, years_raw, projects_raw, edu_codes
     
     def get_top_candidates(self, ranked_resumes: List[Dict], top_k: int = 5) -> List[Dict]:
         """
@@ -133,46 +327,24 @@ class ResumeRanker:
         Returns:
             Comparison results
         """
-        comparison = {
-            'resume1': {
-                'name': resume1.get('extracted_data', {}).get('contact', {}).get('name', 'Candidate 1'),
-                'score': resume1.get('composite_score', 0),
-                'rank': resume1.get('rank', 0)
-            },
-            'resume2': {
-                'name': resume2.get('extracted_data', {}).get('contact', {}).get('name', 'Candidate 2'),
-                'score': resume2.get('composite_score', 0),
-                'rank': resume2.get('rank', 0)
-            },
-            'winner': None,
-            'differences': {}
-        }
+        view1 = _resume_view(resume1, 'Candidate 1')
+        view2 = _resume_view(resume2, 'Candidate 2')
         
         # Determine winner
-        if comparison['resume1']['score'] > comparison['resume2']['score']:
-            comparison['winner'] = 'resume1'
-        elif comparison['resume2']['score'] > comparison['resume1']['score']:
-            comparison['winner'] = 'resume2'
+        if view1.score > view2.score:
+            winner = 'resume1'
+        elif view2.score > view1.score:
+            winner = 'resume2'
         else:
-            comparison['winner'] = 'tie'
+            winner = 'tie'
         
-        # Compare specific aspects
-        r1_data = resume1.get('extracted_data', {})
-        r2_data = resume2.get('extracted_data', {})
-        
-        comparison['differences']['skills'] = {
-            'resume1': r1_data.get('skills', {}).get('total_count', 0),
-            'resume2': r2_data.get('skills', {}).get('total_count', 0)
+        return {
+            'resume1': {'name': view1.name, 'score': view1.score, 'rank': view1.rank},
+            'resume2': {'name': view2.name, 'score': view2.score, 'rank': view2.rank},
+            'winner': winner,
+            'differences': {
+                'skills': {'resume1': view1.skills_count, 'resume2': view2.skills_count},
+                'experience_years': {'resume1': view1.experience_years, 'resume2': view2.experience_years},
+                'education': {'resume1': view1.education_level, 'resume2': view2.education_level}
+            }
         }
-        
-        comparison['differences']['experience_years'] = {
-            'resume1': r1_data.get('summary', {}).get('total_experience_years', 0),
-            'resume2': r2_data.get('summary', {}).get('total_experience_years', 0)
-        }
-        
-        comparison['differences']['education'] = {
-            'resume1': r1_data.get('summary', {}).get('education_level', 'Not specified'),
-            'resume2': r2_data.get('summary', {}).get('education_level', 'Not specified')
-        }
-        
-        return comparison
@@ -3,6 +3,6 @@ Reports Module Init
 """
 from .json_reporter import JSONReporter
 from .csv_reporter import CSVReporter
-from .pdf_reporter import generate_resume_report, generate_ranking_report
+from .pdf_reporter import generate_resume_report, generate_resume_reports_batch, generate_ranking_report
 
-__all__ = ['JSONReporter', 'CSVReporter', 'generate_resume_report', 'generate_ranking_report']
+__all__ = ['JSONReporter', 'CSVReporter', 'generate_resume_report', 'generate_resume_reports_batch', 'generate_ranking_report']
@@ -3,7 +3,7 @@ CSV Reporter
 Generate CSV format reports
 """
 import csv
-from typing import Dict, List
+from typing import Dict, Iterator, List
 from datetime import datetime
 import logging
 
@@ -35,25 +35,7 @@ class CSVReporter:
                 ])
                 
                 # Data rows
-                for resume in ranked_resumes:
-                    contact = resume.get('extracted_data', {}).get('contact', {})
-                    ats_score = resume.get('ats_score', {})
-                    summary = resume.get('extracted_data', {}).get('summary', {})
-                    
-                    writer.writerow([
-                        resume.get('rank', 0),
-                        contact.get('name', 'N/A'),
-                        contact.get('email', 'N/A'),
-                        contact.get('phone', 'N/A'),
-                        ats_score.get('total_score', 0),
-                        ats_score.get('breakdown', {}).get('skills_match', 0),
-                        ats_score.get('breakdown', {}).get('experience_relevance', 0),
-                        summary.get('total_experience_years', 0),
-                        summary.get('total_skills', 0),
-                        summary.get('education_level', 'N/A'),
-                        ats_score.get('match_status', 'N/A'),
-                        ats_score.get('grade', 'N/A')
-                    ])
+                writer.writerows(CSVReporter._ranking_rows(ranked_resumes))
             
             logger.info(f"CSV ranking report saved to {output_path}")
         
@@ -61,6 +43,31 @@ class CSVReporter:
             logger.error(f"Error generating CSV report: {e}")
             raise
     
+    @staticmethod
+    def _ranking_rows(ranked_resumes: List[Dict]) -> Iterator[List]:
+        """Yield one CSV row per ranked resume"""
+        for resume in ranked_resumes:
+            extracted = resume.get('extracted_data', {})
+            contact = extracted.get('contact', {})
+            summary = extracted.get('summary', {})
+            ats_score = resume.get('ats_score', {})
+            breakdown = ats_score.get('breakdown', {})
+            
+            yield [
+                resume.get('rank', 0),
+                contact.get('name', 'N/A'),
+                contact.get('email', 'N/A'),
+                contact.get('phone', 'N/A'),
+                ats_score.get('total_score', 0),
+                breakdown.get('skills_match', 0),
+                breakdown.get('experience_relevance', 0),
+                summary.get('total_experience_years', 0),
+                summary.get('total_skills', 0),
+                summary.get('education_level', 'N/A'),
+                ats_score.get('match_status', 'N/A'),
+                ats_score.get('grade', 'N/A')
+            ]
+    
     @staticmethod
     def generate_skills_comparison(resumes: List[Dict], output_path: str):
         """
@@ -71,13 +78,14 @@ class CSVReporter:
             output_path: Path to save CSV file
         """
         try:
-            # Collect all unique skills
-            all_skills = set()
-            for resume in resumes:
-                skills_data = resume.get('extracted_data', {}).get('skills', {})
-                all_skills.update(skills_data.get('technical_skills', []))
+            # Build each resume's skill set once
+            resume_skillsets = [
+                frozenset(resume.get('extracted_data', {}).get('skills', {}).get('technical_skills', []))
+                for resume in resumes
+            ]
             
-            all_skills = sorted(list(all_skills))
+            # Collect all unique skills
+            all_skills = sorted(frozenset().union(*resume_skillsets))
             
             with open(output_path, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
@@ -88,13 +96,10 @@ class CSVReporter:
                 writer.writerow(['Skill'] + names)
                 
                 # Data rows
-                for skill in all_skills:
-                    row = [skill]
-                    for resume in resumes:
-                        skills_data = resume.get('extracted_data', {}).get('skills', {})
-                        has_skill = skill in skills_data.get('technical_skills', [])
-                        row.append('✓' if has_skill else '✗')
-                    writer.writerow(row)
+                writer.writerows(
+                    [skill] + ['✓' if skill in skillset else '✗' for skillset in resume_skillsets]
+                    for skill in all_skills
+                )
             
             logger.info(f"Skills comparison CSV saved to {output_path}")
         
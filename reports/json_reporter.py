@@ -7,15 +7,40 @@ from typing import Dict, List
 from datetime import datetime
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if orjson is not None else 0
+)
+
+
+def _dumps(obj, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        options = _ORJSON_OPTIONS if indent else _ORJSON_OPTIONS & ~orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=options)
+        except TypeError:
+            # Types orjson can't handle (e.g. big ints); stdlib may still cope
+            pass
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 
 class JSONReporter:
     """Generate JSON format reports"""
     
     @staticmethod
     def generate_single_resume_report(resume_data: Dict, ats_score: Dict, 
-                                     feedback: Dict, output_path: str = None) -> str:
+                                     feedback: Dict, output_path: str = None,
+                                     generated_at: str = None) -> str:
         """
         Generate JSON report for single resume
         
@@ -24,12 +49,13 @@ class JSONReporter:
             ats_score: ATS scoring results
             feedback: Optimization feedback
             output_path: Optional path to save report
+            generated_at: Optional ISO timestamp (shared across a batch)
             
         Returns:
             JSON string
         """
         report = {
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': generated_at or datetime.now().isoformat(),
             'resume_analysis': {
                 'contact': resume_data.get('contact', {}),
                 'summary': resume_data.get('summary', {}),
@@ -43,17 +69,17 @@ class JSONReporter:
             'optimization_feedback': feedback
         }
         
-        json_str = json.dumps(report, indent=2, ensure_ascii=False)
+        json_bytes = _dumps(report)
         
         if output_path:
             try:
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(json_str)
+                with open(output_path, 'wb') as f:
+                    f.write(json_bytes)
                 logger.info(f"JSON report saved to {output_path}")
             except Exception as e:
                 logger.error(f"Error saving JSON report: {e}")
         
-        return json_str
+        return json_bytes.decode('utf-8')
     
     @staticmethod
     def generate_batch_report(results: List[Dict], output_path: str = None) -> str:
@@ -71,21 +97,81 @@ class JSONReporter:
             'generated_at': datetime.now().isoformat(),
             'total_resumes': len(results),
             'results': results,
-            'summary': {
-                'average_score': sum(r.get('ats_score', {}).get('total_score', 0) for r in results) / len(results) if results else 0,
-                'top_score': max((r.get('ats_score', {}).get('total_score', 0) for r in results), default=0),
-                'low_score': min((r.get('ats_score', {}).get('total_score', 0) for r in results), default=0)
-            }
+            'summary': JSONReporter._summarize_scores(results)
         }
         
-        json_str = json.dumps(report, indent=2, ensure_ascii=False)
+        json_bytes = _dumps(report)
         
         if output_path:
             try:
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(json_str)
+                with open(output_path, 'wb') as f:
+                    f.write(json_bytes)
                 logger.info(f"Batch JSON report saved to {output_path}")
             except Exception as e:
                 logger.error(f"Error saving batch JSON report: {e}")
         
-        return json_str
+        return json_bytes.decode('utf-8')
+    
+    @staticmethod
+    def generate_batch_report_stream(results: List[Dict], output_path: str):
+        """
+        Write a batch JSON report incrementally, one result at a time
+        
+        Unlike generate_batch_report, the full report is never held in
+        memory as a single string, which keeps peak memory flat for
+        large batches. Output is compact (one result per line).
+        
+        Args:
+            results: List of resume analysis results
+            output_path: Path to save report
+        """
+        header = _dumps({
+            'generated_at': datetime.now().isoformat(),
+            'total_resumes': len(results),
+            'summary': JSONReporter._summarize_scores(results)
+        }, indent=False)
+        
+        try:
+            with open(output_path, 'wb') as f:
+                f.write(header[:-1] + b',"results":[')
+                for i, result in enumerate(results):
+                    if i:
+                        f.write(b',')
+                    f.write(b'\n')
+                    f.write(_dumps(result, indent=False))
+                f.write(b'\n]}\n')
+            logger.info(f"Batch JSON report saved to {output_path}")
+        except Exception as e:
+            logger.error(f"Error saving batch JSON report: {e}")
+            raise
+    
+    @staticmethod
+    def _summarize_scores(results: List[Dict]) -> Dict:
+        """
+        Compute average, top, and low ATS scores in a single pass
+        
+        Args:
+            results: List of resume analysis results
+            
+        Returns:
+            Dictionary with average_score, top_score, and low_score
+        """
+        if not results:
+            return {'average_score': 0, 'top_score': 0, 'low_score': 0}
+        
+        total = 0
+        top = float('-inf')
+        low = float('inf')
+        for r in results:
+            score = r.get('ats_score', {}).get('total_score', 0)
+            total += score
+            if score > top:
+                top = score
+            if score < low:
+                low = score
+        
+        return {
+            'average_score': total / len(results),
+            'top_score': top,
+            'low_score': low
+        }
@@ -2,13 +2,23 @@
 PDF Reporter
 Generate PDF format reports
 """
+from concurrent.futures import ProcessPoolExecutor
 from fpdf import FPDF
-from typing import Dict, List
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Ranking table layout (column widths sum to the A4 printable width)
+_RANKING_HEADINGS = ('Rank', 'Name', 'Score', 'Grade', 'Match Status')
+_RANKING_COL_WIDTHS = (15, 50, 30, 20, 75)
+_RANKING_TEXT_ALIGN = ('C', 'L', 'C', 'C', 'L')
+
 
 class PDFReporter(FPDF):
     """Generate PDF format reports"""
@@ -40,7 +50,7 @@ class PDFReporter(FPDF):
 
 
 def generate_resume_report(resume_data: Dict, ats_score: Dict, 
-                          feedback: Dict, output_path: str):
+                          feedback: Dict, output_path: str, generated_at: str = None):
     """
     Generate comprehensive PDF report for a single resume
     
@@ -49,6 +59,7 @@ def generate_resume_report(resume_data: Dict, ats_score: Dict,
         ats_score: ATS scoring results
         feedback: Optimization feedback
         output_path: Path to save PDF
+        generated_at: Optional preformatted timestamp (shared across a batch)
     """
     try:
         pdf = PDFReporter()
@@ -56,7 +67,7 @@ def generate_resume_report(resume_data: Dict, ats_score: Dict,
         
         # Report metadata
         pdf.set_font('Arial', '', 10)
-        pdf.cell(0, 6, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", 0, 1)
+        pdf.cell(0, 6, f"Generated: {generated_at or datetime.now().strftime(_TIMESTAMP_FORMAT)}", 0, 1)
         pdf.ln(5)
         
         # Candidate Information
@@ -127,8 +138,7 @@ Number of Positions: {len(resume_data.get('experience', []))}
             pdf.set_font('Arial', 'B', 12)
             pdf.cell(0, 6, 'Critical Issues:', 0, 1)
             pdf.set_font('Arial', '', 10)
-            for issue in feedback['critical_issues']:
-                pdf.multi_cell(0, 5, f"  {issue}")
+            pdf.multi_cell(0, 5, '\n'.join(f"  {issue}" for issue in feedback['critical_issues']))
             pdf.ln(3)
         
         # Improvements
@@ -136,8 +146,7 @@ Number of Positions: {len(resume_data.get('experience', []))}
             pdf.set_font('Arial', 'B', 12)
             pdf.cell(0, 6, 'Suggested Improvements:', 0, 1)
             pdf.set_font('Arial', '', 10)
-            for improvement in feedback['improvements'][:10]:  # Limit to 10
-                pdf.multi_cell(0, 5, f"  {improvement}")
+            pdf.multi_cell(0, 5, '\n'.join(f"  {improvement}" for improvement in feedback['improvements'][:10]))  # Limit to 10
             pdf.ln(3)
         
         # Strong Points
@@ -145,8 +154,7 @@ Number of Positions: {len(resume_data.get('experience', []))}
             pdf.set_font('Arial', 'B', 12)
             pdf.cell(0, 6, 'Strong Points:', 0, 1)
             pdf.set_font('Arial', '', 10)
-            for strength in feedback['strong_points']:
-                pdf.multi_cell(0, 5, f"  {strength}")
+            pdf.multi_cell(0, 5, '\n'.join(f"  {strength}" for strength in feedback['strong_points']))
         
         # Save PDF
         pdf.output(output_path)
@@ -157,6 +165,104 @@ Number of Positions: {len(resume_data.get('experience', []))}
         raise
 
 
+def _generate_resume_report_task(task: Tuple[Dict, Dict, Dict, str, str]) -> Tuple[str, Optional[str]]:
+    """Worker entry point: render one resume report, returning its path and any error message"""
+    resume_data, ats_score, feedback, output_path, generated_at = task
+    try:
+        generate_resume_report(resume_data, ats_score, feedback, output_path, generated_at)
+        return output_path, None
+    except Exception as e:
+        # Worker logging may be unconfigured (spawn), so the parent reports it
+        return output_path, str(e) or type(e).__name__
+
+
+def _report_name(file_name: str, used: Set[str]) -> str:
+    """Report file name for a resume, made unique among the names already used in the batch"""
+    path = Path(file_name)
+    base = path.stem
+    if f"{base}_report.pdf" in used and path.suffix:
+        # jane.pdf and jane.docx -> jane_report.pdf and jane_docx_report.pdf
+        base = f"{path.stem}_{path.suffix.lstrip('.')}"
+    
+    name = f"{base}_report.pdf"
+    copy = 2
+    while name in used:
+        name = f"{base}_{copy}_report.pdf"
+        copy += 1
+    
+    used.add(name)
+    return name
+
+
+def generate_resume_reports_batch(results: List[Dict], output_dir: str,
+                                  max_workers: Optional[int] = None) -> List[str]:
+    """
+    Generate PDF reports for many resumes in parallel worker processes
+    
+    Reports are named after each resume's file name; resumes sharing a
+    stem (e.g. jane.pdf and jane.docx) get distinct report names.
+    
+    Args:
+        results: Batch analysis results (with file_name, extracted_data,
+            ats_score, and feedback keys)
+        output_dir: Directory to save PDFs
+        max_workers: Maximum worker processes (defaults to CPU count)
+        
+    Returns:
+        Paths of the reports that were generated successfully
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    generated_at = datetime.now().strftime(_TIMESTAMP_FORMAT)
+    
+    used_names = set()
+    tasks = [
+        (
+            result.get('extracted_data', {}),
+            result.get('ats_score', {}),
+            result.get('feedback', {}),
+            str(output_dir / _report_name(result.get('file_name', f'resume_{i}'), used_names)),
+            generated_at
+        )
+        for i, result in enumerate(results, 1)
+    ]
+    
+    if not tasks:
+        return []
+    
+    workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+    if workers == 1:
+        outcomes = [_generate_resume_report_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(_generate_resume_report_task, tasks))
+    
+    generated = []
+    for path, error in outcomes:
+        if error is None:
+            generated.append(path)
+        else:
+            logger.error(f"Skipped PDF report {path}: {error}")
+    
+    logger.info(f"Generated {len(generated)}/{len(tasks)} PDF reports in {output_dir}")
+    return generated
+
+
+def _ranking_rows(ranked_resumes: List[Dict]) -> Iterator[Tuple[str, ...]]:
+    """Yield one ranking table row per resume"""
+    for resume in ranked_resumes:
+        contact = resume.get('extracted_data', {}).get('contact', {})
+        ats = resume.get('ats_score', {})
+        
+        yield (
+            str(resume.get('rank', '')),
+            contact.get('name', 'N/A')[:25],
+            f"{ats.get('total_score', 0):.1f}/100",
+            ats.get('grade', 'N/A'),
+            ats.get('match_status', 'N/A')[:30]
+        )
+
+
 def generate_ranking_report(ranked_resumes: List[Dict], output_path: str):
     """
     Generate PDF report with ranked candidates
@@ -172,28 +278,21 @@ def generate_ranking_report(ranked_resumes: List[Dict], output_path: str):
         # Report metadata
         pdf.set_font('Arial', '', 10)
         pdf.cell(0, 6, f"Candidate Ranking Report", 0, 1)
-        pdf.cell(0, 6, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", 0, 1)
+        pdf.cell(0, 6, f"Generated: {datetime.now().strftime(_TIMESTAMP_FORMAT)}", 0, 1)
         pdf.cell(0, 6, f"Total Candidates: {len(ranked_resumes)}", 0, 1)
         pdf.ln(10)
         
         # Rankings table
         pdf.set_font('Arial', 'B', 11)
-        pdf.cell(15, 8, 'Rank', 1, 0, 'C')
-        pdf.cell(50, 8, 'Name', 1, 0, 'C')
-        pdf.cell(30, 8, 'Score', 1, 0, 'C')
-        pdf.cell(20, 8, 'Grade', 1, 0, 'C')
-        pdf.cell(75, 8, 'Match Status', 1, 1, 'C')
+        for width, heading in zip(_RANKING_COL_WIDTHS, _RANKING_HEADINGS):
+            pdf.cell(width, 8, heading, 1, 0, 'C')
+        pdf.ln()
         
         pdf.set_font('Arial', '', 10)
-        for resume in ranked_resumes[:20]:  # Limit to top 20
-            contact = resume.get('extracted_data', {}).get('contact', {})
-            ats = resume.get('ats_score', {})
-            
-            pdf.cell(15, 7, str(resume.get('rank', '')), 1, 0, 'C')
-            pdf.cell(50, 7, contact.get('name', 'N/A')[:25], 1, 0, 'L')
-            pdf.cell(30, 7, f"{ats.get('total_score', 0):.1f}/100", 1, 0, 'C')
-            pdf.cell(20, 7, ats.get('grade', 'N/A'), 1, 0, 'C')
-            pdf.cell(75, 7, ats.get('match_status', 'N/A')[:30], 1, 1, 'L')
+        for row in _ranking_rows(ranked_resumes[:20]):  # Limit to top 20
+            for width, align, value in zip(_RANKING_COL_WIDTHS, _RANKING_TEXT_ALIGN, row):
+                pdf.cell(width, 7, value, 1, 0, align)
+            pdf.ln()
         
         pdf.output(output_path)
         logger.info(f"Ranking PDF report saved to {output_path}")
@@ -5,15 +5,75 @@ ATS scoring and job description matching using TF-IDF, embeddings, and keyword a
 Created by: MAYANK SHARMA
 Website: https://mayankiitj.vercel.app
 """
+import bisect
+import os
 import re
-from typing import Dict, List, Tuple
+import hashlib
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, NamedTuple, Tuple
 import numpy as np
+from sklearn.base import clone
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import logging
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+_KEYWORD_PATTERN = re.compile(r'\b[a-zA-Z][a-zA-Z+#\.]{2,}\b')
+_REQUIRED_EXPERIENCE_PATTERNS = [
+    re.compile(r'(\d+)\+?\s*years?\s+(?:of\s+)?experience', re.IGNORECASE),
+    re.compile(r'(?:minimum|at least)\s+(\d+)\s*years?', re.IGNORECASE),
+    re.compile(r'(\d+)-(\d+)\s*years?', re.IGNORECASE)
+]
+
+# Common skill patterns in JDs
+_JD_SKILL_KEYWORDS = (
+    'python', 'java', 'javascript', 'react', 'sql', 'aws', 'docker',
+    'kubernetes', 'machine learning', 'data analysis', 'tensorflow'
+)
+
+# Score thresholds (inclusive lower bounds) and the label for each band
+_GRADE_THRESHOLDS = (50, 60, 70, 80, 90)
+_GRADES = ('F', 'D', 'C', 'B', 'A', 'A+')
+_MATCH_STATUS_THRESHOLDS = (55, 70, 85)
+_MATCH_STATUSES = (
+    'Weak Match - Not Recommended',
+    'Moderate Match - Consider',
+    'Good Match - Recommended',
+    'Strong Match - Highly Recommended'
+)
+
+_STOP_WORDS = frozenset({'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'a', 'an'})
+
+# Number of job descriptions whose derived features are kept in memory
+_JD_CACHE_SIZE = 32
+
+
+def _build_automaton(words):
+    """Build an Aho-Corasick automaton mapping each word to itself, or None if unavailable"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+_JD_SKILL_AUTOMATON = _build_automaton(_JD_SKILL_KEYWORDS)
+
+
+class _JDFeatures(NamedTuple):
+    """Resume-independent analysis of a job description, shared across resumes"""
+    keywords: List[str]
+    keyword_automaton: object
+    required_years: int
+    skills: FrozenSet[str]
+
 
 class ResumeScorer:
     """
@@ -22,8 +82,27 @@ class ResumeScorer:
     - Semantic similarity via embeddings (20%)
     """
     
-    def __init__(self, use_embeddings=True):
+    def __init__(self, use_embeddings=True, embedding_cache_size: int = 1024,
+                 embedding_backend: str = 'torch', onnx_model_dir: str = 'models/all-MiniLM-L6-v2-onnx',
+                 use_quantization: bool = False):
+        """
+        Initialize scorer
+        
+        Args:
+            use_embeddings: Use a sentence-embedding model for semantic scoring
+            embedding_cache_size: Number of embeddings to memoize (0 disables)
+            embedding_backend: 'torch' (sentence-transformers) or 'onnx' (ONNX Runtime on CPU)
+            onnx_model_dir: Directory with an exported model.onnx and tokenizer,
+                used when embedding_backend is 'onnx'
+            use_quantization: Apply dynamic INT8 quantization to the torch model's
+                Linear layers (CPU only; on a GPU the model runs in FP16 instead)
+        """
         self.use_embeddings = use_embeddings
+        self.use_quantization = use_quantization
+        self.embedding_cache_size = embedding_cache_size
+        self._embedding_cache = OrderedDict()
+        self._jd_features = OrderedDict()
+        self._tfidf_models = OrderedDict()
         self.tfidf_vectorizer = TfidfVectorizer(
             max_features=1000,
             stop_words='english',
@@ -33,13 +112,49 @@ class ResumeScorer:
         # Initialize embedding model if requested
         self.embedding_model = None
         if use_embeddings:
+            self.embedding_model = self._load_embedding_model(embedding_backend, onnx_model_dir)
+            if self.embedding_model is None:
+                self.use_embeddings = False
+    
+    def _load_embedding_model(self, backend: str, onnx_model_dir: str):
+        """Load the embedding model for the requested backend, or None on failure"""
+        if backend == 'onnx':
             try:
-                from sentence_transformers import SentenceTransformer
-                self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
-                logger.info("Loaded embedding model: all-MiniLM-L6-v2")
+                from utils.onnx_encoder import ONNXSentenceEncoder
+                return ONNXSentenceEncoder(onnx_model_dir)
             except Exception as e:
-                logger.warning(f"Could not load embedding model: {e}. Using TF-IDF only.")
-                self.use_embeddings = False
+                logger.warning(f"Could not load ONNX embedding model: {e}. Falling back to sentence-transformers.")
+        
+        try:
+            import torch
+            from sentence_transformers import SentenceTransformer
+            device = 'cuda' if torch.cuda.is_available() else 'cpu'
+            model = SentenceTransformer('all-MiniLM-L6-v2', device=device)
+            logger.info(f"Loaded embedding model: all-MiniLM-L6-v2 ({device})")
+            if device == 'cuda':
+                # FP16 roughly halves GPU inference time; quantization is CPU-only
+                model.half()
+            else:
+                torch.set_num_threads(min(8, os.cpu_count() or 1))
+                if self.use_quantization:
+                    self._quantize_model(model)
+            return model
+        except Exception as e:
+            logger.warning(f"Could not load embedding model: {e}. Using TF-IDF only.")
+            return None
+    
+    @staticmethod
+    def _quantize_model(model):
+        """Dynamically quantize the transformer's Linear layers to INT8 in place"""
+        try:
+            import torch
+            transformer = model[0]
+            transformer.auto_model = torch.quantization.quantize_dynamic(
+                transformer.auto_model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            logger.info("Applied dynamic INT8 quantization to embedding model")
+        except Exception as e:
+            logger.warning(f"Could not quantize embedding model: {e}. Using FP32.")
     
     def score_resume(self, resume_data: Dict, jd_text: str) -> Dict:
         """
@@ -57,22 +172,65 @@ class ResumeScorer:
         # Prepare resume text
         resume_text = self._prepare_resume_text(resume_data)
         
+        # Semantic similarity score (20% weight)
+        if self.use_embeddings and self.embedding_model:
+            semantic_score = self._calculate_semantic_score(resume_text, jd_text)
+        else:
+            # Fallback to TF-IDF similarity
+            semantic_score = self._calculate_tfidf_similarity(resume_text, jd_text)
+        
+        result = self._combine_scores(resume_data, resume_text, jd_text, semantic_score)
+        
+        logger.info(f"Scoring completed: {result['total_score']}/100 ({result['grade']})")
+        return result
+    
+    def score_resumes_batch(self, resumes: List[Dict], jd_text: str, batch_size: int = 32) -> List[Dict]:
+        """
+        Score many resumes against one job description
+        
+        All resume texts and the JD are embedded in a single batched encode,
+        and semantic similarities come from one matrix-vector product.
+        
+        Args:
+            resumes: List of extracted resume data dictionaries
+            jd_text: Job description text
+            batch_size: Batch size for the embedding model
+            
+        Returns:
+            List of score dictionaries, in input order
+        """
+        logger.info(f"Starting batch scoring of {len(resumes)} resumes...")
+        
+        resume_texts = [self._prepare_resume_text(resume_data) for resume_data in resumes]
+        
+        if self.use_embeddings and self.embedding_model:
+            semantic_scores = self._calculate_semantic_scores_batch(resume_texts, jd_text, batch_size)
+        else:
+            semantic_scores = [self._calculate_tfidf_similarity(text, jd_text) for text in resume_texts]
+        
+        results = [
+            self._combine_scores(resume_data, resume_text, jd_text, semantic_score)
+            for resume_data, resume_text, semantic_score in zip(resumes, resume_texts, semantic_scores)
+        ]
+        
+        logger.info(f"Batch scoring completed: {len(results)} resumes")
+        return results
+    
+    def _combine_scores(self, resume_data: Dict, resume_text: str, jd_text: str,
+                        semantic_score: float) -> Dict:
+        """Compute the remaining component scores and assemble the weighted result"""
+        jd_features = self._get_jd_features(jd_text)
+        
         # 1. Keyword matching score (80% weight)
-        keyword_score = self._calculate_keyword_score(resume_text, jd_text)
+        keyword_score = self._calculate_keyword_score(resume_text.lower(), jd_features)
         
         # 2. Skills matching score
-        skills_score = self._calculate_skills_match(resume_data, jd_text)
+        skills_score = self._calculate_skills_match(resume_data, jd_features.skills)
         
         # 3. Experience relevance score
-        experience_score = self._calculate_experience_score(resume_data, jd_text)
+        experience_score = self._calculate_experience_score(resume_data, jd_features.required_years)
         
-        # 4. Semantic similarity score (20% weight)
-        semantic_score = 0
-        if self.use_embeddings and self.embedding_model:
-            semantic_score = self._calculate_semantic_score(resume_text, jd_text)
-        else:
-            # Fallback to TF-IDF similarity
-            semantic_score = self._calculate_tfidf_similarity(resume_text, jd_text)
+        # 4. Semantic similarity score is computed by the caller
         
         # 5. Format/ATS compatibility score
         format_score = self._calculate_format_score(resume_data)
@@ -86,8 +244,8 @@ class ResumeScorer:
             format_score * 0.10
         )
         
-        result = {
-            'final_score': round(total_score, 2),
+        return {
+            'total_score': round(total_score, 2),
             'breakdown': {
                 'keyword_score': round(keyword_score, 2),
                 'skills_score': round(skills_score, 2),
@@ -98,9 +256,6 @@ class ResumeScorer:
             'grade': self._get_grade(total_score),
             'status': self._get_match_status(total_score)
         }
-        
-        logger.info(f"Scoring completed: {result['total_score']}/100 ({result['grade']})")
-        return result
     
     def _prepare_resume_text(self, resume_data: Dict) -> str:
         """Combine all resume sections into text"""
@@ -131,35 +286,74 @@ class ResumeScorer:
         
         return ' '.join(parts)
     
-    def _calculate_keyword_score(self, resume_text: str, jd_text: str) -> float:
-        """Calculate keyword matching score"""
-        # Extract important keywords from JD
-        jd_keywords = self._extract_keywords(jd_text)
-        resume_lower = resume_text.lower()
+    def _get_jd_features(self, jd_text: str) -> _JDFeatures:
+        """
+        Analyze a job description once and memoize the result
+        
+        Keywords, their automaton, required years, and mentioned skills
+        depend only on the JD, so bulk scoring against one JD computes
+        them a single time.
+        
+        Args:
+            jd_text: Job description text
+            
+        Returns:
+            _JDFeatures for the JD
+        """
+        key = hashlib.blake2b(jd_text.encode('utf-8'), digest_size=16).digest()
+        features = self._jd_features.get(key)
+        if features is not None:
+            self._jd_features.move_to_end(key)
+            return features
+        
+        jd_lower = jd_text.lower()
+        keywords = self._extract_keywords(jd_lower)
+        features = _JDFeatures(
+            keywords=keywords,
+            keyword_automaton=_build_automaton(keywords) if keywords else None,
+            required_years=self._extract_required_experience(jd_text),
+            skills=self._extract_jd_skills(jd_lower)
+        )
+        
+        self._jd_features[key] = features
+        if len(self._jd_features) > _JD_CACHE_SIZE:
+            self._jd_features.popitem(last=False)
+        return features
+    
+    def _calculate_keyword_score(self, resume_lower: str, jd_features: _JDFeatures) -> float:
+        """Calculate keyword matching score for lowercased resume text"""
+        jd_keywords = jd_features.keywords
         
         if not jd_keywords:
             return 50.0
         
         # Count matches
-        matches = sum(1 for keyword in jd_keywords if keyword.lower() in resume_lower)
+        if jd_features.keyword_automaton is not None:
+            # One linear pass over the resume finds every keyword occurrence
+            matches = len({keyword for _, keyword in jd_features.keyword_automaton.iter(resume_lower)})
+        else:
+            matches = sum(1 for keyword in jd_keywords if keyword in resume_lower)
         score = (matches / len(jd_keywords)) * 100
         
         return min(100, score)
     
-    def _extract_keywords(self, text: str) -> List[str]:
-        """Extract important keywords from text"""
+    def _extract_keywords(self, text_lower: str) -> List[str]:
+        """Extract important keywords from already-lowercased text"""
         # Remove common words and extract meaningful terms
-        words = re.findall(r'\b[a-zA-Z][a-zA-Z+#\.]{2,}\b', text)
-        
-        # Filter out very common words
-        stop_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'a', 'an'}
-        keywords = [w for w in words if w.lower() not in stop_words]
+        words = _KEYWORD_PATTERN.findall(text_lower)
         
-        # Return unique keywords
-        return list(set(keywords))
+        # Filter out very common words and return unique keywords in first-seen order
+        return list(dict.fromkeys(w for w in words if w not in _STOP_WORDS))
     
-    def _calculate_skills_match(self, resume_data: Dict, jd_text: str) -> float:
-        """Calculate how many required skills are present"""
+    def _extract_jd_skills(self, jd_lower: str) -> FrozenSet[str]:
+        """Find known skills mentioned in lowercased JD text"""
+        if _JD_SKILL_AUTOMATON is not None:
+            # Single pass over the JD finds every skill (overlaps included)
+            return frozenset(skill for _, skill in _JD_SKILL_AUTOMATON.iter(jd_lower))
+        return frozenset(skill for skill in _JD_SKILL_KEYWORDS if skill in jd_lower)
+    
+    def _calculate_skills_match(self, resume_data: Dict, jd_skills: FrozenSet[str]) -> float:
+        """Calculate how many of the JD's skills are present"""
         if 'skills' not in resume_data:
             return 0.0
         
@@ -169,18 +363,6 @@ class ResumeScorer:
         resume_skills.update(s.lower() for s in skills_data.get('technical_skills', []))
         resume_skills.update(s.lower() for s in skills_data.get('soft_skills', []))
         
-        # Extract skills mentioned in JD
-        jd_lower = jd_text.lower()
-        jd_skills = set()
-        
-        # Common skill patterns in JDs
-        skill_keywords = ['python', 'java', 'javascript', 'react', 'sql', 'aws', 'docker', 
-                         'kubernetes', 'machine learning', 'data analysis', 'tensorflow']
-        
-        for skill in skill_keywords:
-            if skill in jd_lower:
-                jd_skills.add(skill)
-        
         if not jd_skills:
             return 70.0  # Default if no specific skills detected
         
@@ -190,14 +372,11 @@ class ResumeScorer:
         
         return min(100, score)
     
-    def _calculate_experience_score(self, resume_data: Dict, jd_text: str) -> float:
-        """Score based on experience relevance"""
+    def _calculate_experience_score(self, resume_data: Dict, required_years: int) -> float:
+        """Score based on experience relevance to the JD's required years"""
         if 'experience' not in resume_data or not resume_data['experience']:
             return 30.0
         
-        # Extract years of experience required from JD
-        required_years = self._extract_required_experience(jd_text)
-        
         # Get total experience from resume
         total_years = resume_data.get('summary', {}).get('total_experience_years', 0)
         
@@ -217,14 +396,8 @@ class ResumeScorer:
     
     def _extract_required_experience(self, jd_text: str) -> int:
         """Extract required years of experience from JD"""
-        patterns = [
-            r'(\d+)\+?\s*years?\s+(?:of\s+)?experience',
-            r'(?:minimum|at least)\s+(\d+)\s*years?',
-            r'(\d+)-(\d+)\s*years?'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, jd_text, re.IGNORECASE)
+        for pattern in _REQUIRED_EXPERIENCE_PATTERNS:
+            match = pattern.search(jd_text)
             if match:
                 return int(match.group(1))
         
@@ -233,30 +406,119 @@ class ResumeScorer:
     def _calculate_semantic_score(self, resume_text: str, jd_text: str) -> float:
         """Calculate semantic similarity using embeddings"""
         try:
-            resume_emb = self.embedding_model.encode(resume_text[:1000])  # Limit length
-            jd_emb = self.embedding_model.encode(jd_text[:1000])
+            # Limit length; both texts go through the model in one batch
+            resume_emb, jd_emb = self._encode_cached([resume_text[:1000], jd_text[:1000]])
             
-            # Calculate cosine similarity
-            similarity = cosine_similarity(
-                resume_emb.reshape(1, -1),
-                jd_emb.reshape(1, -1)
-            )[0][0]
+            # Embeddings are L2-normalized, so cosine similarity is a dot product
+            similarity = float(resume_emb @ jd_emb)
             
             return similarity * 100
         
         except Exception as e:
-            logger.error(f"Error calculating semantic score: {e}")
-            return 50.0
+            logger.error(f"Error calculating semantic score: {e}. Disabling embeddings, using TF-IDF.")
+            self.use_embeddings = False
+            return self._calculate_tfidf_similarity(resume_text, jd_text)
+    
+    def _calculate_semantic_scores_batch(self, resume_texts: List[str], jd_text: str,
+                                         batch_size: int = 32) -> List[float]:
+        """Calculate semantic similarity of many resumes to one JD"""
+        try:
+            embeddings = self._encode_cached(
+                [jd_text[:1000]] + [text[:1000] for text in resume_texts],
+                batch_size=batch_size
+            )
+            similarities = embeddings[1:] @ embeddings[0]
+            return (similarities * 100).tolist()
+        
+        except Exception as e:
+            logger.error(f"Error calculating batch semantic scores: {e}. Disabling embeddings, using TF-IDF.")
+            self.use_embeddings = False
+            return [self._calculate_tfidf_similarity(text, jd_text) for text in resume_texts]
+    
+    def _encode_cached(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        """
+        Encode texts to L2-normalized embeddings, reusing cached embeddings
+        
+        Texts missing from the cache are encoded together in a single
+        model.encode call, sorted by length so each batch pads to similar
+        lengths.
+        
+        Args:
+            texts: Texts to encode
+            batch_size: Batch size for the embedding model
+            
+        Returns:
+            Array of shape (len(texts), dim)
+        """
+        keys = [hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest() for text in texts]
+        
+        # Hits are collected up front so evictions below cannot drop them
+        found = {}
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key in self._embedding_cache:
+                self._embedding_cache.move_to_end(key)
+                found[key] = self._embedding_cache[key]
+            else:
+                missing.setdefault(key, text)
+        
+        if missing:
+            # Smart batching: similar-length texts share a batch, minimizing padding
+            missing = dict(sorted(missing.items(), key=lambda item: len(item[1])))
+            embeddings = self.embedding_model.encode(
+                list(missing.values()),
+                batch_size=batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            )
+            encoded = dict(zip(missing.keys(), embeddings))
+            found.update(encoded)
+            
+            if self.embedding_cache_size > 0:
+                self._embedding_cache.update(encoded)
+                while len(self._embedding_cache) > self.embedding_cache_size:
+                    self._embedding_cache.popitem(last=False)
+        
+        return np.stack([found[key] for key in keys])
     
     def _calculate_tfidf_similarity(self, resume_text: str, jd_text: str) -> float:
         """Fallback TF-IDF similarity calculation"""
         try:
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform([jd_text, resume_text])
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            return similarity * 100
+            tfidf_model = self._get_tfidf_model(jd_text)
+            if tfidf_model is not None:
+                vectorizer, jd_vector = tfidf_model
+                resume_vector = vectorizer.transform([resume_text])
+            else:
+                # JD has no usable terms on its own; learn vocabulary from both texts
+                tfidf_matrix = self.tfidf_vectorizer.fit_transform([jd_text, resume_text])
+                jd_vector, resume_vector = tfidf_matrix[0], tfidf_matrix[1]
+            
+            # Rows are L2-normalized by the vectorizer, so cosine similarity is a dot product
+            similarity = jd_vector.multiply(resume_vector).sum()
+            return float(similarity) * 100
         except:
             return 50.0
     
+    def _get_tfidf_model(self, jd_text: str):
+        """Return a (vectorizer, jd_vector) pair fitted on the JD, or None if the JD has no vocabulary"""
+        key = hashlib.blake2b(jd_text.encode('utf-8'), digest_size=16).digest()
+        if key in self._tfidf_models:
+            self._tfidf_models.move_to_end(key)
+            return self._tfidf_models[key]
+        
+        vectorizer = clone(self.tfidf_vectorizer)
+        try:
+            jd_vector = vectorizer.fit_transform([jd_text])
+        except ValueError:
+            # Empty vocabulary (e.g. the JD is only stop words)
+            return None
+        
+        self._tfidf_models[key] = (vectorizer, jd_vector)
+        if len(self._tfidf_models) > _JD_CACHE_SIZE:
+            self._tfidf_models.popitem(last=False)
+        return vectorizer, jd_vector
+    
     def _calculate_format_score(self, resume_data: Dict) -> float:
         """Score based on ATS-friendly formatting"""
         score = 100
@@ -285,26 +547,8 @@ class ResumeScorer:
     
     def _get_grade(self, score: float) -> str:
         """Convert score to letter grade"""
-        if score >= 90:
-            return 'A+'
-        elif score >= 80:
-            return 'A'
-        elif score >= 70:
-            return 'B'
-        elif score >= 60:
-            return 'C'
-        elif score >= 50:
-            return 'D'
-        else:
-            return 'F'
+        return _GRADES[bisect.bisect_right(_GRADE_THRESHOLDS, score)]
     
     def _get_match_status(self, score: float) -> str:
         """Get match status description"""
-        if score >= 85:
-            return 'Strong Match - Highly Recommended'
-        elif score >= 70:
-            return 'Good Match - Recommended'
-        elif score >= 55:
-            return 'Moderate Match - Consider'
-        else:
-            return 'Weak Match - Not Recommended'
+        return _MATCH_STATUSES[bisect.bisect_right(_MATCH_STATUS_THRESHOLDS, score)]
@@ -4,6 +4,28 @@ Test configuration for pytest
 import pytest
 import sys
 from pathlib import Path
+import numpy as np
 
 # Add parent directory to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+class FakeEmbeddingModel:
+    """Deterministic stand-in for a SentenceTransformer (letter-count vectors)"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def encode(self, sentences, **kwargs):
+        self.calls.append(sentences)
+        texts = [sentences] if isinstance(sentences, str) else list(sentences)
+        embs = np.array([[t.lower().count(c) for c in 'aeiourstln'] for t in texts], dtype=np.float32) + 1
+        if kwargs.get('normalize_embeddings'):
+            embs /= np.linalg.norm(embs, axis=1, keepdims=True)
+        return embs[0] if isinstance(sentences, str) else embs
+
+
+@pytest.fixture
+def fake_embedding_model():
+    """Factory for fresh fake embedding models, each recording its own encode calls"""
+    return FakeEmbeddingModel
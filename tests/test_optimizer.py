@@ -0,0 +1,93 @@
+"""
+Test Optimizer Module
+"""
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from optimizer import ResumeOptimizer
+
+
+def make_resume_data(name, email=None):
+    """Build minimal extracted resume data"""
+    return {
+        'contact': {'name': name, 'email': email},
+        'skills': {'technical_skills': ['python', 'sql'], 'soft_skills': [], 'total_count': 2},
+        'experience': [],
+        'education': [],
+        'summary': {'total_experience_years': 2, 'education_level': 'Bachelor'}
+    }
+
+
+def count_generations(optimizer, monkeypatch):
+    """Record each full feedback generation (cache miss) on the optimizer"""
+    generations = []
+    original = optimizer._identify_critical_issues
+
+    def counting(resume_data):
+        generations.append(resume_data['contact']['name'])
+        return original(resume_data)
+
+    monkeypatch.setattr(optimizer, '_identify_critical_issues', counting)
+    return generations
+
+
+class TestResumeOptimizer:
+    """Test feedback memoization"""
+
+    def test_cache_hit_skips_regeneration(self, monkeypatch):
+        """Test identical inputs reuse the cached feedback"""
+        optimizer = ResumeOptimizer()
+        generations = count_generations(optimizer, monkeypatch)
+        ats_score = {'total_score': 72}
+
+        first = optimizer.generate_feedback(make_resume_data('Alice'), "python developer", ats_score)
+        second = optimizer.generate_feedback(make_resume_data('Alice'), "python developer", ats_score)
+        optimizer.generate_feedback(make_resume_data('Alice'), "java developer", ats_score)
+
+        assert second == first
+        assert generations == ['Alice', 'Alice']
+
+    def test_mutating_result_does_not_corrupt_cache(self):
+        """Test callers get copies, not the cached feedback itself"""
+        optimizer = ResumeOptimizer()
+        resume_data = make_resume_data('Alice')
+
+        first = optimizer.generate_feedback(resume_data)
+        expected = list(first['critical_issues'])
+        first['critical_issues'].append('edited by caller')
+        first['optimization_score'] = -1
+
+        second = optimizer.generate_feedback(resume_data)
+        second['improvements'].clear()
+        third = optimizer.generate_feedback(resume_data)
+
+        assert second['critical_issues'] == expected
+        assert second['optimization_score'] != -1
+        assert third['improvements'] == first['improvements']
+
+    def test_cache_evicts_least_recently_used(self, monkeypatch):
+        """Test the cache keeps at most cache_size entries, evicting the oldest"""
+        optimizer = ResumeOptimizer(cache_size=2)
+        generations = count_generations(optimizer, monkeypatch)
+
+        for name in ('Alice', 'Bob', 'Alice', 'Carol', 'Bob'):
+            optimizer.generate_feedback(make_resume_data(name))
+
+        # Alice's hit refreshed it, so Carol evicted Bob
+        assert generations == ['Alice', 'Bob', 'Carol', 'Bob']
+        assert len(optimizer._feedback_cache) == 2
+
+    def test_cache_size_zero_disables_caching(self, monkeypatch):
+        """Test cache_size=0 regenerates every time and never builds a cache key"""
+        optimizer = ResumeOptimizer(cache_size=0)
+        generations = count_generations(optimizer, monkeypatch)
+        monkeypatch.setattr(optimizer, '_make_cache_key', lambda *args: pytest.fail("cache key built"))
+
+        optimizer.generate_feedback(make_resume_data('Alice'))
+        optimizer.generate_feedback(make_resume_data('Alice'))
+
+        assert generations == ['Alice', 'Alice']
+        assert len(optimizer._feedback_cache) == 0
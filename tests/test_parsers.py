@@ -8,7 +8,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from parsers import ResumeParser, PDFParser, DOCXParser, TXTParser
+from parsers import ResumeParser, ParseResult, PDFParser, DOCXParser, TXTParser
 
 
 class TestResumeParser:
@@ -56,6 +56,32 @@ Python, Java, Machine Learning
         assert result['format'] == '.txt'
 
 
+class TestParseResult:
+    """Test parse result container"""
+    
+    def test_dict_style_access(self):
+        """Test backward-compatible dict access"""
+        result = ParseResult(text="Test content", file_path="test.txt", lines=1)
+        
+        assert result['text'] == "Test content"
+        assert 'lines' in result
+        assert 'unknown' not in result
+        assert result.get('unknown', 'default') == 'default'
+        
+        with pytest.raises(KeyError):
+            result['unknown']
+    
+    def test_as_dict(self):
+        """Test conversion to plain dictionary"""
+        result = ParseResult(text="Test content", pages=2)
+        data = result.as_dict()
+        
+        assert data['text'] == "Test content"
+        assert data['pages'] == 2
+        if sys.version_info >= (3, 10):
+            assert not hasattr(result, '__dict__')
+
+
 class TestPDFParser:
     """Test PDF parser"""
     
@@ -64,6 +90,25 @@ class TestPDFParser:
         parser = PDFParser()
         assert parser is not None
         assert '.pdf' in parser.supported_extensions
+    
+    def test_parallel_page_extraction(self, tmp_path):
+        """Test parallel extraction matches serial page order"""
+        fpdf = pytest.importorskip("fpdf")
+        
+        pdf = fpdf.FPDF()
+        pdf.set_font('helvetica', '', 12)
+        for i in range(1, 7):
+            pdf.add_page()
+            pdf.cell(0, 10, f"Page {i} content")
+        pdf_file = tmp_path / "multipage.pdf"
+        pdf.output(str(pdf_file))
+        
+        serial = PDFParser().parse(str(pdf_file))
+        parallel = PDFParser(max_workers=3, parallel_page_threshold=2).parse(str(pdf_file))
+        
+        assert parallel.pages == 6
+        assert parallel.text == serial.text
+        assert parallel.text.index('Page 1') < parallel.text.index('Page 6')
 
 
 class TestDOCXParser:
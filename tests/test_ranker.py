@@ -0,0 +1,133 @@
+"""
+Test Ranker Module
+"""
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ranker import ResumeRanker
+
+
+def make_resume(name, total_skills, years, education_level, projects=0):
+    """Build a minimal resume entry for ranking"""
+    return {
+        'extracted_data': {
+            'contact': {'name': name},
+            'skills': {'total_count': total_skills},
+            'experience': [{'duration_years': years}],
+            'summary': {'education_level': education_level, 'total_experience_years': years},
+            'projects': [{}] * projects
+        }
+    }
+
+
+class TestResumeRanker:
+    """Test resume ranking"""
+
+    def test_initialization(self):
+        """Test ranker initialization"""
+        ranker = ResumeRanker()
+        assert ranker is not None
+        assert sum(ranker.weights.values()) == pytest.approx(1.0)
+
+    def test_composite_score(self):
+        """Test composite score calculation"""
+        ranker = ResumeRanker()
+        resume = make_resume('Alice', total_skills=10, years=2, education_level='Master', projects=2)
+
+        # skills 50*0.4 + experience 40*0.3 + education 85*0.2 + projects 50*0.1
+        assert ranker._calculate_composite_score(resume) == pytest.approx(54.0)
+
+    def test_ats_score_short_circuit(self):
+        """Test that an available ATS total score is used directly"""
+        ranker = ResumeRanker()
+        resume = make_resume('Bob', total_skills=0, years=0, education_level='Not specified')
+        resume['ats_score'] = {'total_score': 77.5, 'breakdown': {}}
+
+        assert ranker._calculate_composite_score(resume) == 77.5
+
+    def test_rank_resumes(self):
+        """Test ranking order and rank numbers"""
+        ranker = ResumeRanker()
+        resumes = [
+            make_resume('Low', total_skills=2, years=0, education_level='Diploma'),
+            make_resume('High', total_skills=25, years=6, education_level='Phd', projects=4),
+            make_resume('Mid', total_skills=10, years=2, education_level='Bachelor', projects=1)
+        ]
+
+        ranked = ranker.rank_resumes(resumes)
+
+        assert [r['extracted_data']['contact']['name'] for r in ranked] == ['High', 'Mid', 'Low']
+        assert [r['rank'] for r in ranked] == [1, 2, 3]
+        assert ranked[0]['original_index'] == 1
+
+    def test_score_cache(self):
+        """Test composite scores are reused across ranking calls"""
+        ranker = ResumeRanker(cache_size=16)
+        resumes = [
+            make_resume('Alice', total_skills=10, years=2, education_level='Master', projects=2),
+            make_resume('Bob', total_skills=4, years=1, education_level='Bachelor')
+        ]
+
+        first = [r['composite_score'] for r in ranker.rank_resumes(resumes)]
+        assert len(ranker._score_cache) == 2
+
+        second = [r['composite_score'] for r in ranker.rank_resumes(resumes)]
+        assert first == second
+        assert len(ranker._score_cache) == 2
+
+    def test_rank_ties_keep_input_order(self):
+        """Test resumes with equal scores keep their original order"""
+        ranker = ResumeRanker()
+        resumes = [
+            make_resume('First', total_skills=5, years=1, education_level='Bachelor'),
+            make_resume('Second', total_skills=5, years=1, education_level='Bachelor')
+        ]
+
+        ranked = ranker.rank_resumes(resumes)
+
+        assert [r['original_index'] for r in ranked] == [0, 1]
+
+    def test_education_level_case_insensitive(self):
+        """Test education levels match regardless of case or abbreviation"""
+        ranker = ResumeRanker()
+        scores = [
+            ranker._calculate_composite_score(make_resume('A', 0, 0, level))
+            for level in ('Phd', 'PhD', 'masters', 'B.Tech', 'Unknown')
+        ]
+
+        # Education contributes 20% of the composite score
+        assert scores == [20.0, 20.0, 17.0, 14.0, 6.0]
+
+    def test_compare_resumes(self):
+        """Test side-by-side comparison"""
+        ranker = ResumeRanker()
+        ranked = ranker.rank_resumes([
+            make_resume('Alice', total_skills=20, years=5, education_level='Master'),
+            make_resume('Bob', total_skills=5, years=1, education_level='Bachelor')
+        ])
+
+        comparison = ranker.compare_resumes(ranked[0], ranked[1])
+
+        assert comparison['winner'] == 'resume1'
+        assert comparison['resume1']['name'] == 'Alice'
+        assert comparison['resume2']['rank'] == 2
+        assert comparison['differences']['skills'] == {'resume1': 20, 'resume2': 5}
+        assert comparison['differences']['education'] == {'resume1': 'Master', 'resume2': 'Bachelor'}
+
+    def test_rank_top_k_matches_full_ranking(self):
+        """Test top-K selection agrees with the full ranking, including ties"""
+        ranker = ResumeRanker()
+        resumes = [
+            make_resume(f'Candidate {i}', total_skills=(i * 7) % 4, years=0, education_level='Bachelor')
+            for i in range(30)
+        ]
+
+        full = [r['original_index'] for r in ranker.rank_resumes(resumes)[:5]]
+        top = ranker.rank_top_k(resumes, top_k=5)
+
+        assert [r['original_index'] for r in top] == full
+        assert [r['rank'] for r in top] == [1, 2, 3, 4, 5]
+        assert ranker.rank_top_k(resumes, top_k=0) == []
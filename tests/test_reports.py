@@ -0,0 +1,196 @@
+"""
+Test Reports Module
+"""
+import csv
+import json
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from reports import json_reporter
+from reports.json_reporter import JSONReporter
+from reports.csv_reporter import CSVReporter
+from reports.pdf_reporter import generate_resume_report, generate_resume_reports_batch, generate_ranking_report
+
+
+def make_result(name, score):
+    """Build a minimal batch analysis result"""
+    return {
+        'file_name': f'{name}.pdf',
+        'extracted_data': {
+            'contact': {'name': name, 'email': f'{name.lower()}@email.com'},
+            'skills': {'technical_skills': ['python', 'sql'], 'total_count': 2},
+            'summary': {'total_experience_years': 3, 'education_level': 'Master'}
+        },
+        'ats_score': {'total_score': score, 'grade': 'B', 'breakdown': {}}
+    }
+
+
+class TestJSONReporter:
+    """Test JSON reporter"""
+
+    def test_batch_report(self, tmp_path):
+        """Test batch report content and file output"""
+        output = tmp_path / "batch.json"
+        results = [make_result('Alice', 80), make_result('Bob', 60)]
+
+        json_str = JSONReporter.generate_batch_report(results, str(output))
+        report = json.loads(json_str)
+
+        assert report['total_resumes'] == 2
+        assert report['summary']['average_score'] == 70
+        assert report['summary']['top_score'] == 80
+        assert report['summary']['low_score'] == 60
+        assert json.loads(output.read_text(encoding='utf-8')) == report
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_batch_report_stream(self, tmp_path, monkeypatch, use_orjson):
+        """Test streamed batch report matches the in-memory report"""
+        if not use_orjson:
+            monkeypatch.setattr(json_reporter, 'orjson', None)
+        output = tmp_path / "batch_stream.json"
+        results = [make_result('Alice', 80), make_result('Bob', 60), make_result('Zoë', 70)]
+
+        JSONReporter.generate_batch_report_stream(results, str(output))
+        streamed = json.loads(output.read_text(encoding='utf-8'))
+        expected = json.loads(JSONReporter.generate_batch_report(results))
+
+        assert streamed['results'] == expected['results']
+        assert streamed['summary'] == expected['summary']
+        assert streamed['total_resumes'] == 3
+
+    def test_empty_batch_summary(self):
+        """Test batch summary for an empty result list"""
+        report = json.loads(JSONReporter.generate_batch_report([]))
+
+        assert report['summary'] == {'average_score': 0, 'top_score': 0, 'low_score': 0}
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Test serialization without orjson installed"""
+        monkeypatch.setattr(json_reporter, 'orjson', None)
+
+        json_str = JSONReporter.generate_single_resume_report(
+            {'contact': {'name': 'Zoë'}}, {'total_score': 50}, {}
+        )
+
+        assert 'Zoë' in json_str
+        assert json.loads(json_str)['ats_score']['total_score'] == 50
+
+
+class TestCSVReporter:
+    """Test CSV reporter"""
+
+    def test_ranking_report(self, tmp_path):
+        """Test ranking CSV has a header and one row per resume"""
+        output = tmp_path / "ranking.csv"
+        ranked = [make_result('Alice', 80), make_result('Bob', 60)]
+        for rank, resume in enumerate(ranked, 1):
+            resume['rank'] = rank
+
+        CSVReporter.generate_ranking_report(ranked, str(output))
+
+        with open(output, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+
+        assert rows[0][0] == 'Rank'
+        assert len(rows) == 3
+        assert rows[1][:3] == ['1', 'Alice', 'alice@email.com']
+        assert rows[2][4] == '60'
+
+    def test_skills_comparison(self, tmp_path):
+        """Test skills matrix marks each candidate's skills"""
+        output = tmp_path / "skills.csv"
+        alice = make_result('Alice', 80)
+        bob = make_result('Bob', 60)
+        bob['extracted_data']['skills']['technical_skills'] = ['java', 'python']
+
+        CSVReporter.generate_skills_comparison([alice, bob], str(output))
+
+        with open(output, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+
+        assert rows[0] == ['Skill', 'Alice', 'Bob']
+        assert rows[1:] == [['java', '✗', '✓'], ['python', '✓', '✓'], ['sql', '✓', '✗']]
+
+
+class TestPDFReporter:
+    """Test PDF reporter"""
+
+    def test_ranking_report(self, tmp_path):
+        """Test ranking PDF is written"""
+        output = tmp_path / "ranking.pdf"
+        ranked = [make_result(f'Candidate {i}', 90 - i) for i in range(25)]
+        for rank, resume in enumerate(ranked, 1):
+            resume['rank'] = rank
+            resume['ats_score']['match_status'] = 'Good Match - Recommended'
+
+        generate_ranking_report(ranked, str(output))
+
+        assert output.read_bytes().startswith(b'%PDF')
+
+    def test_resume_report(self, tmp_path):
+        """Test single resume PDF is written"""
+        output = tmp_path / "resume.pdf"
+        resume = make_result('Alice', 80)
+        feedback = {
+            'critical_issues': ['Missing phone number'],
+            'improvements': ['Add more projects', 'Add certifications'],
+            'strong_points': ['Complete contact information']
+        }
+
+        generate_resume_report(resume['extracted_data'], resume['ats_score'], feedback, str(output))
+
+        assert output.read_bytes().startswith(b'%PDF')
+
+    def test_resume_reports_batch(self, tmp_path):
+        """Test batch PDF generation across worker processes"""
+        results = [make_result(name, 70) for name in ('Alice', 'Bob', 'Carol')]
+        for result in results:
+            result['feedback'] = {'improvements': ['Add more projects']}
+
+        paths = generate_resume_reports_batch(results, str(tmp_path), max_workers=2)
+
+        assert sorted(Path(p).name for p in paths) == ['Alice_report.pdf', 'Bob_report.pdf', 'Carol_report.pdf']
+        assert all(Path(p).read_bytes().startswith(b'%PDF') for p in paths)
+
+    def test_resume_reports_batch_unique_names(self, tmp_path):
+        """Test resumes sharing a file stem get distinct report files"""
+        results = [make_result('Jane', 70) for _ in range(4)]
+        results[1]['file_name'] = 'Jane.docx'
+
+        paths = generate_resume_reports_batch(results, str(tmp_path), max_workers=1)
+
+        assert [Path(p).name for p in paths] == ['Jane_report.pdf', 'Jane_docx_report.pdf', 'Jane_pdf_report.pdf', 'Jane_pdf_2_report.pdf']
+
+    def test_resume_reports_batch_logs_failures(self, tmp_path, monkeypatch, caplog):
+        """Test a failed report is skipped and its error logged by the caller"""
+        from reports import pdf_reporter
+
+        def fake_report(resume_data, ats_score, feedback, output_path, generated_at=None):
+            if 'Bob' in output_path:
+                raise RuntimeError("font missing")
+
+        monkeypatch.setattr(pdf_reporter, 'generate_resume_report', fake_report)
+        results = [make_result(name, 70) for name in ('Alice', 'Bob')]
+
+        paths = pdf_reporter.generate_resume_reports_batch(results, str(tmp_path), max_workers=1)
+
+        assert [Path(p).name for p in paths] == ['Alice_report.pdf']
+        assert 'font missing' in caplog.text
+
+    def test_resume_reports_batch_shares_timestamp(self, tmp_path, monkeypatch):
+        """Test batch reports are stamped with a single timestamp"""
+        from reports import pdf_reporter
+        stamps = []
+        monkeypatch.setattr(
+            pdf_reporter, 'generate_resume_report',
+            lambda resume_data, ats_score, feedback, output_path, generated_at=None: stamps.append(generated_at)
+        )
+
+        results = [make_result(name, 70) for name in ('Alice', 'Bob')]
+        pdf_reporter.generate_resume_reports_batch(results, str(tmp_path), max_workers=1)
+
+        assert len(stamps) == 2
+        assert stamps[0] is not None and stamps[0] == stamps[1]
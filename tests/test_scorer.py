@@ -8,6 +8,18 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from scorer import ResumeScorer
+import numpy as np
+
+
+@pytest.fixture
+def make_embedding_scorer(fake_embedding_model):
+    """Factory for scorers wired to a fake embedding model"""
+    def make():
+        scorer = ResumeScorer(use_embeddings=False)
+        scorer.use_embeddings = True
+        scorer.embedding_model = fake_embedding_model()
+        return scorer
+    return make
 
 
 class TestResumeScorer:
@@ -70,3 +82,183 @@ class TestResumeScorer:
         assert scorer._get_grade(65) == 'C'
         assert scorer._get_grade(55) == 'D'
         assert scorer._get_grade(45) == 'F'
+        assert scorer._get_grade(90) == 'A+'
+        assert scorer._get_grade(89.99) == 'A'
+        assert scorer._get_grade(50) == 'D'
+
+    def test_match_status_boundaries(self):
+        """Test match status thresholds are inclusive lower bounds"""
+        scorer = ResumeScorer(use_embeddings=False)
+        
+        assert scorer._get_match_status(85) == 'Strong Match - Highly Recommended'
+        assert scorer._get_match_status(84.9) == 'Good Match - Recommended'
+        assert scorer._get_match_status(70) == 'Good Match - Recommended'
+        assert scorer._get_match_status(55) == 'Moderate Match - Consider'
+        assert scorer._get_match_status(54.9) == 'Weak Match - Not Recommended'
+
+    def test_semantic_embedding_cache(self, make_embedding_scorer):
+        """Test repeated texts are not re-encoded"""
+        scorer = make_embedding_scorer()
+        
+        first = scorer._calculate_semantic_score("python developer", "python engineer")
+        second = scorer._calculate_semantic_score("python developer", "python engineer")
+        
+        assert first == pytest.approx(second)
+        assert 0 < first <= 100
+        assert len(scorer.embedding_model.calls) == 1
+        assert sorted(scorer.embedding_model.calls[0]) == ["python developer", "python engineer"]
+
+    def test_batch_scoring_matches_single(self, make_embedding_scorer):
+        """Test batch scoring agrees with scoring resumes one at a time"""
+        scorer = make_embedding_scorer()
+        jd_text = "Python developer with 3 years of experience in machine learning and SQL"
+        resumes = [
+            {'skills': {'technical_skills': ['python', 'sql']}, 'experience': [{'role': 'Data Engineer', 'description': 'Built SQL pipelines'}]},
+            {'skills': {'technical_skills': ['java']}, 'experience': []},
+            {'skills': {'technical_skills': ['python', 'machine learning']}, 'summary': {'total_experience_years': 4},
+             'experience': [{'role': 'ML Engineer', 'description': 'Trained models'}]}
+        ]
+        
+        batch = scorer.score_resumes_batch(resumes, jd_text)
+        
+        single_scorer = make_embedding_scorer()
+        for resume, result in zip(resumes, batch):
+            resume_text = single_scorer._prepare_resume_text(resume)
+            semantic = single_scorer._calculate_semantic_score(resume_text, jd_text)
+            expected = single_scorer._combine_scores(resume, resume_text, jd_text, semantic)
+            assert result['breakdown'] == pytest.approx(expected['breakdown'], abs=0.01)
+        
+        assert len(scorer.embedding_model.calls) == 1
+
+    def test_quantized_embeddings_close_to_fp32(self):
+        """Test INT8 quantization keeps similarities within 1% of FP32"""
+        pytest.importorskip("sentence_transformers")
+        
+        fp32 = ResumeScorer(use_embeddings=True)
+        int8 = ResumeScorer(use_embeddings=True, use_quantization=True)
+        if fp32.embedding_model is None or int8.embedding_model is None:
+            pytest.skip("Embedding model not available")
+        
+        resume_text = "Senior Python engineer building machine learning pipelines on AWS"
+        jd_text = "Looking for a Python developer with ML and cloud experience"
+        
+        assert int8._calculate_semantic_score(resume_text, jd_text) == pytest.approx(
+            fp32._calculate_semantic_score(resume_text, jd_text), rel=0.01
+        )
+
+    def test_keyword_score_automaton_matches_substring_scan(self, monkeypatch):
+        """Test the Aho-Corasick keyword count agrees with plain substring checks"""
+        pytest.importorskip("ahocorasick")
+        import scorer as scorer_module
+        
+        resume_text = "built python services and sql pipelines with docker on aws"
+        jd_text = "python developer: sql, docker, kubernetes, aws and python testing"
+        
+        scorer = ResumeScorer(use_embeddings=False)
+        features = scorer._get_jd_features(jd_text)
+        assert features.keyword_automaton is not None
+        with_automaton = scorer._calculate_keyword_score(resume_text, features)
+        
+        monkeypatch.setattr(scorer_module, 'ahocorasick', None)
+        fallback = ResumeScorer(use_embeddings=False)
+        features = fallback._get_jd_features(jd_text)
+        assert features.keyword_automaton is None
+        assert fallback._calculate_keyword_score(resume_text, features) == with_automaton
+
+    def test_tfidf_vectorizer_fitted_once_per_jd(self):
+        """Test the TF-IDF fallback reuses the vectorizer fitted on the JD"""
+        scorer = ResumeScorer(use_embeddings=False)
+        jd_text = "Python developer with SQL and Docker experience"
+        
+        identical = scorer._calculate_tfidf_similarity(jd_text, jd_text)
+        vectorizer = scorer._tfidf_models[next(iter(scorer._tfidf_models))][0]
+        unrelated = scorer._calculate_tfidf_similarity("Pastry chef and baker", jd_text)
+        
+        assert identical == pytest.approx(100.0)
+        assert unrelated == pytest.approx(0.0)
+        assert len(scorer._tfidf_models) == 1
+        assert scorer._tfidf_models[next(iter(scorer._tfidf_models))][0] is vectorizer
+
+    def test_extract_keywords_unique_ordered(self):
+        """Test keywords are deduplicated and keep first-seen order"""
+        scorer = ResumeScorer(use_embeddings=False)
+        
+        keywords = scorer._extract_keywords("python and sql for the python team using sql and c++")
+        
+        assert keywords == ['python', 'sql', 'team', 'using']
+
+    def test_skills_match_detects_overlapping_jd_skills(self, monkeypatch):
+        """Test JD skill detection finds overlapping skills with and without the automaton"""
+        import scorer as scorer_module
+        
+        scorer = ResumeScorer(use_embeddings=False)
+        resume_data = {'skills': {'technical_skills': ['Java', 'SQL'], 'soft_skills': []}}
+        jd_text = "javascript and sql engineer, machine learning a plus"
+        
+        # 'java' occurs inside 'javascript': jd skills are java, javascript, sql, machine learning
+        jd_skills = scorer._extract_jd_skills(jd_text)
+        assert jd_skills == {'java', 'javascript', 'sql', 'machine learning'}
+        assert scorer._calculate_skills_match(resume_data, jd_skills) == pytest.approx(50.0)
+        
+        monkeypatch.setattr(scorer_module, '_JD_SKILL_AUTOMATON', None)
+        assert scorer._extract_jd_skills(jd_text) == jd_skills
+
+    def test_semantic_failure_falls_back_to_tfidf(self, make_embedding_scorer):
+        """Test an encode failure switches the scorer to TF-IDF for later calls"""
+        class BrokenModel:
+            def __init__(self):
+                self.calls = 0
+            
+            def encode(self, sentences, **kwargs):
+                self.calls += 1
+                raise RuntimeError("out of memory")
+        
+        scorer = make_embedding_scorer()
+        scorer.embedding_model = BrokenModel()
+        resume_text = "python developer with sql experience"
+        jd_text = "python engineer with sql"
+        
+        semantic = scorer._calculate_semantic_score(resume_text, jd_text)
+        
+        assert semantic == pytest.approx(scorer._calculate_tfidf_similarity(resume_text, jd_text))
+        assert scorer.use_embeddings is False
+        
+        scorer._calculate_semantic_scores_batch([resume_text], jd_text)
+        scorer.score_resumes_batch([{'skills': {'technical_skills': ['python']}}], jd_text)
+        assert scorer.embedding_model.calls == 2
+
+    def test_batch_encode_sorted_by_length(self, make_embedding_scorer, fake_embedding_model):
+        """Test uncached texts are encoded shortest first and returned in input order"""
+        scorer = make_embedding_scorer()
+        texts = ["a much longer resume text here", "short", "medium length"]
+        
+        embeddings = scorer._encode_cached(texts)
+        
+        assert scorer.embedding_model.calls == [["short", "medium length", "a much longer resume text here"]]
+        expected = fake_embedding_model().encode(texts, normalize_embeddings=True)
+        assert np.allclose(embeddings, expected)
+
+    def test_jd_features_computed_once_per_jd(self):
+        """Test bulk scoring analyzes the job description only once"""
+        scorer = ResumeScorer(use_embeddings=False)
+        jd_text = "Senior Python engineer, 5+ years of experience with SQL and AWS"
+        resumes = [{'skills': {'technical_skills': ['python']}}, {'skills': {'technical_skills': ['aws']}}]
+        
+        scorer.score_resumes_batch(resumes, jd_text)
+        features = scorer._get_jd_features(jd_text)
+        
+        assert len(scorer._jd_features) == 1
+        assert features.required_years == 5
+        assert features.skills == {'python', 'sql', 'aws'}
+        assert features.keywords[:2] == ['senior', 'python']
+
+    def test_embedding_cache_eviction_keeps_current_hits(self, make_embedding_scorer):
+        """Test cache hits survive evictions triggered within the same encode"""
+        scorer = make_embedding_scorer()
+        scorer.embedding_cache_size = 2
+        
+        first = scorer._encode_cached(["python", "java"])
+        second = scorer._encode_cached(["java", "python", "sql"])
+        
+        assert np.allclose(second[:2], first[::-1])
+        assert len(scorer._embedding_cache) == 2
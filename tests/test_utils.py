@@ -0,0 +1,369 @@
+"""
+Test Utils Module
+"""
+import pytest
+import sys
+from pathlib import Path
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.data_cleaner import DataCleaner
+from utils.embeddings import EmbeddingsManager
+from utils.metrics import MetricsCalculator
+from utils.onnx_encoder import mean_pool
+
+
+class TestONNXEncoder:
+    """Test ONNX encoder helpers"""
+    
+    def test_mean_pool_ignores_padding(self):
+        """Test mean pooling averages only unmasked tokens"""
+        hidden = np.array([[[1.0, 2.0], [3.0, 4.0], [100.0, 100.0]]])
+        mask = np.array([[1, 1, 0]])
+        
+        pooled = mean_pool(hidden, mask)
+        
+        assert pooled.shape == (1, 2)
+        assert pooled[0].tolist() == [2.0, 3.0]
+
+
+class TestDataCleaner:
+    """Test DataCleaner text normalization"""
+    
+    def test_clean_text_collapses_whitespace(self):
+        """Test whitespace runs and line breaks collapse to single spaces"""
+        text = "  Senior\r\n\tEngineer   at\n\nAcme!!!  "
+        
+        assert DataCleaner.clean_text(text) == "Senior Engineer at Acme!"
+        assert DataCleaner.clean_text(text, lowercase=True) == "senior engineer at acme!"
+        assert DataCleaner.clean_text("") == ""
+
+
+@pytest.fixture
+def make_embeddings_manager(fake_embedding_model):
+    """Factory for EmbeddingsManagers wired to a fake model"""
+    def make(**kwargs):
+        manager = EmbeddingsManager(**kwargs)
+        manager.model = fake_embedding_model()
+        return manager
+    return make
+
+
+def reference_cosine(a, b):
+    """Plain cosine similarity for checking results"""
+    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+
+class TestEmbeddingsManager:
+    """Test embedding similarity helpers"""
+    
+    @pytest.fixture(params=['simsimd', 'numba', 'numpy'])
+    def backend(self, request, monkeypatch):
+        """Run similarity tests against each available kernel"""
+        import utils.embeddings as embeddings_module
+        if request.param == 'simsimd':
+            pytest.importorskip('simsimd')
+        else:
+            monkeypatch.setattr(embeddings_module, 'simsimd', None)
+        if request.param == 'numba':
+            pytest.importorskip('numba')
+            monkeypatch.setattr(embeddings_module, '_NUMBA_MIN_CANDIDATES', 0)
+        else:
+            monkeypatch.setattr(embeddings_module, '_numba_cos_matrix', lambda: None)
+        return request.param
+    
+    def test_similarity_single_encode(self, backend, make_embeddings_manager, fake_embedding_model):
+        """Test pairwise similarity encodes both texts in one call"""
+        manager = make_embeddings_manager()
+        
+        similarity = manager.similarity("python developer", "data engineer")
+        
+        a, b = fake_embedding_model().encode(["python developer", "data engineer"])
+        assert similarity == pytest.approx(reference_cosine(a, b), abs=1e-6)
+        assert manager.model.calls == [["python developer", "data engineer"]]
+    
+    def test_batch_similarity_matches_pairwise(self, backend, make_embeddings_manager, fake_embedding_model):
+        """Test batch similarity agrees with plain cosine for every candidate"""
+        manager = make_embeddings_manager()
+        query = "python machine learning engineer"
+        candidates = ["python developer", "sales manager", "ml researcher"]
+        
+        similarities = manager.batch_similarity(query, candidates)
+        
+        embs = fake_embedding_model().encode([query] + candidates)
+        expected = [reference_cosine(embs[0], emb) for emb in embs[1:]]
+        assert similarities == pytest.approx(expected, abs=1e-6)
+        assert len(manager.model.calls) == 1
+        assert manager.batch_similarity(query, []) == []
+    
+    def test_precomputed_query_matches_batch_similarity(self, backend, make_embeddings_manager):
+        """Test an encoded query can be scored against candidates without re-encoding"""
+        manager = make_embeddings_manager()
+        query = "python machine learning engineer"
+        candidates = ["python developer", "sales manager", "ml researcher"]
+        expected = manager.batch_similarity(query, candidates)
+        
+        query_emb = manager.encode_query(query)
+        candidate_embs = manager.encode(candidates)
+        calls_before = len(manager.model.calls)
+        similarities = manager.batch_similarity_precomputed(query_emb, candidate_embs)
+        
+        assert query_emb.shape == (10,)
+        assert np.linalg.norm(query_emb) == pytest.approx(1.0, abs=1e-6)
+        assert similarities.tolist() == pytest.approx(expected, abs=1e-6)
+        assert len(manager.model.calls) == calls_before
+    
+    def test_precomputed_unnormalized_inputs(self, backend):
+        """Test raw (unnormalized) vectors give true cosine similarity"""
+        rng = np.random.default_rng(0)
+        query_emb = rng.normal(size=16).astype(np.float32) * 3
+        candidate_embs = rng.normal(size=(5, 16)).astype(np.float32) * 5
+        
+        similarities = EmbeddingsManager.batch_similarity_precomputed(query_emb, candidate_embs, normalized=False)
+        
+        expected = [reference_cosine(query_emb, emb) for emb in candidate_embs]
+        assert similarities.tolist() == pytest.approx(expected, abs=1e-5)
+    
+    def test_encode_cache_skips_repeated_texts(self, make_embeddings_manager):
+        """Test cached texts are not re-encoded and results keep input order"""
+        manager = make_embeddings_manager(cache_size=2)
+        
+        first = manager.encode(["python", "java"])
+        second = manager.encode(["java", "sql", "python", "java"])
+        
+        assert manager.model.calls == [["python", "java"], ["sql"]]
+        assert np.allclose(second[0], first[1])
+        assert np.allclose(second[2], first[0])
+        assert np.allclose(second[3], first[1])
+        assert len(manager._cache) == 2
+    
+    def test_encode_empty_input(self, make_embeddings_manager):
+        """Test encoding no texts returns an empty array without calling the model"""
+        manager = make_embeddings_manager()
+        
+        embeddings = manager.encode([])
+        
+        assert embeddings is not None and embeddings.shape[0] == 0
+        assert manager.model.calls == []
+    
+    def test_cached_embeddings_round_trip(self, tmp_path, fake_embedding_model):
+        """Test embeddings cached to disk load as a memmap and support text lookups"""
+        texts = ["python developer", "data engineer", "sales manager"]
+        embeddings = fake_embedding_model().encode(texts)
+        filepath = str(tmp_path / "embeddings.npy")
+        
+        EmbeddingsManager.cache_embeddings(embeddings, filepath, texts=texts)
+        loaded = EmbeddingsManager.load_cached_embeddings(filepath)
+        
+        assert isinstance(loaded, np.memmap)
+        assert np.array_equal(loaded, embeddings)
+        assert np.array_equal(
+            EmbeddingsManager.lookup_cached_embeddings(filepath, ["sales manager", "python developer"]),
+            embeddings[[2, 0]]
+        )
+        assert EmbeddingsManager.lookup_cached_embeddings(filepath, ["unknown"]) is None
+    
+    def test_cache_overwrite_without_texts_drops_stale_index(self, tmp_path, fake_embedding_model):
+        """Test overwriting a cache without texts removes the old lookup index"""
+        model = fake_embedding_model()
+        filepath = str(tmp_path / "embeddings.npy")
+        
+        EmbeddingsManager.cache_embeddings(model.encode(["x", "y", "z"]), filepath, texts=["x", "y", "z"])
+        EmbeddingsManager.cache_embeddings(model.encode(["a", "b"]), filepath)
+        
+        assert EmbeddingsManager.lookup_cached_embeddings(filepath, ["x"]) is None
+        assert not (tmp_path / "embeddings.keys.json").exists()
+        with pytest.raises(ValueError):
+            EmbeddingsManager.cache_embeddings(model.encode(["a", "b"]), filepath, texts=["a"])
+    
+    def test_int8_quantization_preserves_cosine(self, tmp_path):
+        """Test int8-quantized cached embeddings keep cosine similarities within 1%"""
+        rng = np.random.default_rng(0)
+        embeddings = rng.normal(size=(20, 384)).astype(np.float32)
+        embeddings[3] = 0.0
+        
+        quantized, scale = EmbeddingsManager.quantize_int8(embeddings)
+        assert quantized.dtype == np.int8 and scale.shape == (20, 1)
+        
+        filepath = str(tmp_path / "embeddings.npy")
+        texts = [f"resume {i}" for i in range(20)]
+        EmbeddingsManager.cache_embeddings(embeddings, filepath, texts=texts, quantize=True)
+        loaded = EmbeddingsManager.load_cached_embeddings(filepath)
+        
+        assert loaded.dtype == np.float32
+        assert np.allclose(loaded[3], 0.0)
+        for i in (0, 7, 19):
+            assert reference_cosine(loaded[i], loaded[1]) == pytest.approx(
+                reference_cosine(embeddings[i], embeddings[1]), abs=0.01
+            )
+        assert np.allclose(EmbeddingsManager.lookup_cached_embeddings(filepath, ["resume 7"]), loaded[[7]])
+    
+    def test_encode_normalizes_by_default(self, make_embeddings_manager):
+        """Test encode returns unit vectors unless normalization is disabled"""
+        manager = make_embeddings_manager()
+        
+        normalized = manager.encode(["python developer"])
+        raw = manager.encode(["python developer"], normalize=False)
+        
+        assert np.linalg.norm(normalized[0]) == pytest.approx(1.0)
+        assert np.linalg.norm(raw[0]) > 1.0
+        assert len(manager.model.calls) == 2
+    
+    def test_encode_sorts_multi_batch_input_by_length(self, make_embeddings_manager, fake_embedding_model):
+        """Test inputs spanning several batches are encoded shortest first, returned in order"""
+        manager = make_embeddings_manager()
+        texts = ["a much longer resume section", "short", "mid length", "tiny"]
+        
+        embeddings = manager.encode(texts, batch_size=2)
+        
+        assert manager.model.calls == [["tiny", "short", "mid length", "a much longer resume section"]]
+        assert np.allclose(embeddings, fake_embedding_model().encode(texts, normalize_embeddings=True))
+    
+    def test_numba_cos_matrix_matches_numpy(self):
+        """Test the JIT cosine kernel agrees with NumPy, including zero rows"""
+        pytest.importorskip('numba')
+        from utils.embeddings_numba import cos_matrix
+        
+        rng = np.random.default_rng(0)
+        A = rng.normal(size=(3, 16)).astype(np.float32)
+        B = rng.normal(size=(5, 16)).astype(np.float32)
+        B[2] = 0.0
+        out = np.empty((3, 5), dtype=np.float32)
+        
+        cos_matrix(A, B, out)
+        
+        expected = [[reference_cosine(a, b) if b.any() else 0.0 for b in B] for a in A]
+        assert np.allclose(out, expected, atol=1e-5)
+    
+    def test_batch_top_k(self, backend, make_embeddings_manager):
+        """Test batch_top_k agrees with a full stable ranking of batch_similarity"""
+        manager = make_embeddings_manager()
+        query = "python machine learning engineer"
+        # Repeated texts force ties at the k-th score
+        candidates = ["python developer", "sales manager", "ml researcher", "python engineer"] * 50
+        
+        top = manager.batch_top_k(query, candidates, k=7)
+        similarities = np.array(manager.batch_similarity(query, candidates))
+        
+        expected = np.argsort(-similarities, kind='stable')[:7].tolist()
+        assert [index for index, _ in top] == expected
+        assert [score for _, score in top] == pytest.approx(similarities[expected].tolist(), abs=1e-6)
+        assert len(manager.batch_top_k(query, candidates[:3], k=10)) == 3
+        assert manager.batch_top_k("python", [], k=3) == []
+    
+    def test_model_loaded_lazily(self, monkeypatch, fake_embedding_model):
+        """Test the model is loaded on first use, once, and not at construction"""
+        loads = []
+        
+        def fake_load(manager):
+            loads.append(manager)
+            manager._model_load_attempted = True
+            manager._model = fake_embedding_model()
+        
+        monkeypatch.setattr(EmbeddingsManager, '_load_model', fake_load)
+        manager = EmbeddingsManager()
+        
+        assert loads == []
+        assert manager.warm() is True
+        manager.encode(["python"])
+        assert len(loads) == 1
+    
+    @pytest.mark.parametrize('quantize', [False, True])
+    def test_compressed_cache_round_trip(self, tmp_path, quantize):
+        """Test compressed caches load back as float32 close to the originals"""
+        rng = np.random.default_rng(0)
+        embeddings = rng.normal(size=(50, 384)).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        texts = [f"resume {i}" for i in range(50)]
+        filepath = str(tmp_path / "embeddings.npz")
+        
+        EmbeddingsManager.cache_embeddings(embeddings, filepath, texts=texts, quantize=quantize, compress=True)
+        loaded = EmbeddingsManager.load_cached_embeddings(filepath)
+        
+        assert loaded.dtype == np.float32
+        assert np.allclose(loaded, embeddings, atol=0.01)
+        assert not (tmp_path / "embeddings.scale.npy").exists()
+        assert np.array_equal(EmbeddingsManager.lookup_cached_embeddings(filepath, ["resume 9"]), loaded[[9]])
+
+
+class TestMetricsCalculator:
+    """Test resume metrics"""
+    
+    def test_keyword_density_whole_words(self):
+        """Test keywords are counted case-insensitively as whole words"""
+        text = "Python, C++ and machine learning; python ML. JavaScript"
+        
+        density = MetricsCalculator.calculate_keyword_density(
+            text, ['Python', 'C++', 'machine learning', 'java']
+        )
+        
+        assert density == pytest.approx({'Python': 25.0, 'C++': 12.5, 'machine learning': 12.5, 'java': 0.0})
+        assert MetricsCalculator.calculate_keyword_density("", ['python']) == {'python': 0.0}
+        assert MetricsCalculator.calculate_keyword_density(text, []) == {}
+    
+    def test_keyword_density_automaton_matches_regex(self, monkeypatch):
+        """Test the Aho-Corasick path gives the same densities as the regex path"""
+        pytest.importorskip("ahocorasick")
+        import utils.metrics as metrics_module
+        
+        keywords = [f"skill{i}" for i in range(20)] + ['python', 'c++', 'machine learning', 'learning', 'java']
+        text = "Python and C++ for machine learning, deep learning, skill3 skill12 skill3x java javascript"
+        
+        with_automaton = MetricsCalculator.calculate_keyword_density(text, keywords)
+        monkeypatch.setattr(metrics_module, 'ahocorasick', None)
+        
+        assert MetricsCalculator.calculate_keyword_density(text, keywords) == with_automaton
+        assert with_automaton['learning'] > 0 and with_automaton['skill3'] > 0
+    
+    def test_readability_score_bands(self):
+        """Test readability bands from average sentence length"""
+        sentence = " ".join(["word"] * 17)
+        
+        assert MetricsCalculator.calculate_readability_score("") == 50.0
+        assert MetricsCalculator.calculate_readability_score(sentence) == 100.0
+        assert MetricsCalculator.calculate_readability_score("Short. Very short. Tiny") == 70.0
+    
+    def test_experience_score_components(self):
+        """Test experience score sums capped years, positions, and description bonuses"""
+        experiences = [
+            {'duration_years': 2, 'description': 'x' * 250},
+            {'duration_years': 1.5, 'description': 'x' * 150},
+            {'duration_years': None, 'description': None}
+        ]
+        
+        # 35 (years) + 24 (positions) + 15 (descriptions)
+        assert MetricsCalculator.calculate_experience_score(experiences) == pytest.approx(74.0)
+        assert MetricsCalculator.calculate_experience_score([{'duration_years': 10}]) == pytest.approx(58.0)
+        assert MetricsCalculator.calculate_experience_score([]) == 0.0
+    
+    @pytest.mark.parametrize('backend', ['automaton', 'regex'])
+    def test_keyword_matcher_built_once_per_keyword_set(self, backend, monkeypatch):
+        """Test repeated density calls with the same keywords reuse the built matcher"""
+        import utils.metrics as metrics_module
+        if backend == 'automaton':
+            pytest.importorskip("ahocorasick")
+            builder = metrics_module._keyword_automaton
+        else:
+            monkeypatch.setattr(metrics_module, 'ahocorasick', None)
+            builder = metrics_module._keyword_pattern
+        
+        builder.cache_clear()
+        for text in ("python and sql", "java developer", "SQL, Python"):
+            MetricsCalculator.calculate_keyword_density(text, ['Python', 'SQL', 'java'])
+        MetricsCalculator.calculate_keyword_density("python", ['java', 'sql', 'PYTHON'])
+        
+        info = builder.cache_info()
+        assert info.misses == 1 and info.hits == 3
+    
+    def test_completeness_score(self):
+        """Test completeness adds the weight of each present section"""
+        resume = {
+            'contact': {'email': 'a@b.com', 'phone': '555', 'github': 'gh'},
+            'skills': {'technical_skills': ['python'], 'soft_skills': []},
+            'experience': [{'role': 'Engineer'}],
+            'projects': [{'name': 'x'}]
+        }
+        
+        assert MetricsCalculator.calculate_completeness_score(resume) == 65
+        assert MetricsCalculator.calculate_completeness_score({}) == 0
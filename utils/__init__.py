@@ -4,5 +4,6 @@ Utils Module Init
 from .data_cleaner import DataCleaner
 from .embeddings import EmbeddingsManager
 from .metrics import MetricsCalculator
+from .onnx_encoder import ONNXSentenceEncoder
 
-__all__ = ['DataCleaner', 'EmbeddingsManager', 'MetricsCalculator']
+__all__ = ['DataCleaner', 'EmbeddingsManager', 'MetricsCalculator', 'ONNXSentenceEncoder']
@@ -9,6 +9,13 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_REPEATED_PUNCT_PATTERN = re.compile(r'([.!?])\1+')
+_URL_PATTERN = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+_EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_PATTERN = re.compile(r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+_SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+_EXTRA_NEWLINES_PATTERN = re.compile(r'\n{3,}')
+
 
 class DataCleaner:
     """Clean and normalize resume text data"""
@@ -28,20 +35,14 @@ class DataCleaner:
         if not text:
             return ""
         
-        # Remove multiple spaces
-        text = re.sub(r'\s+', ' ', text)
+        # Collapse all whitespace runs (including line breaks) and strip ends
+        text = ' '.join(text.split())
         
         # Remove special characters but keep alphanumeric and basic punctuation
         # text = re.sub(r'[^\w\s.,!?-]', '', text)
         
-        # Normalize line breaks
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
-        
         # Remove excessive punctuation
-        text = re.sub(r'([.!?])\1+', r'\1', text)
-        
-        # Strip whitespace
-        text = text.strip()
+        text = _REPEATED_PUNCT_PATTERN.sub(r'\1', text)
         
         if lowercase:
             text = text.lower()
@@ -51,20 +52,17 @@ class DataCleaner:
     @staticmethod
     def remove_urls(text: str) -> str:
         """Remove URLs from text"""
-        url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-        return re.sub(url_pattern, '', text)
+        return _URL_PATTERN.sub('', text)
     
     @staticmethod
     def remove_emails(text: str) -> str:
         """Remove email addresses from text"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        return re.sub(email_pattern, '', text)
+        return _EMAIL_PATTERN.sub('', text)
     
     @staticmethod
     def remove_phone_numbers(text: str) -> str:
         """Remove phone numbers from text"""
-        phone_pattern = r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        return re.sub(phone_pattern, '', text)
+        return _PHONE_PATTERN.sub('', text)
     
     @staticmethod
     def normalize_whitespace(text: str) -> str:
@@ -108,10 +106,10 @@ class DataCleaner:
     def extract_sentences(text: str) -> List[str]:
         """Extract sentences from text"""
         # Simple sentence splitting
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENTENCE_SPLIT_PATTERN.split(text)
         return [s.strip() for s in sentences if s.strip()]
     
     @staticmethod
     def remove_extra_newlines(text: str) -> str:
         """Remove excessive newlines"""
-        return re.sub(r'\n{3,}', '\n\n', text)
+        return _EXTRA_NEWLINES_PATTERN.sub('\n\n', text)
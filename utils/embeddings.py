@@ -2,44 +2,131 @@
 Embeddings Utility
 Handle text embeddings for semantic similarity
 """
+import functools
+import hashlib
+import json
 import numpy as np
-from typing import List, Optional
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Tuple
 import logging
 
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
 logger = logging.getLogger(__name__)
 
+# Candidate count from which the Numba kernel is worth its one-off import
+# (~0.2 s); per call it beats NumPy on unnormalized rows at any size
+_NUMBA_MIN_CANDIDATES = 100
+
+# Candidate count above which GPU scoring outweighs host-device transfers
+_GPU_MIN_CANDIDATES = 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _cuda_available() -> bool:
+    """Whether torch can see a CUDA device (checked once per process)"""
+    try:
+        import torch
+        return torch.cuda.is_available()
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_cos_matrix():
+    """Import the Numba cosine kernel on first use, or None without numba"""
+    try:
+        from .embeddings_numba import cos_matrix
+        return cos_matrix
+    except ImportError:
+        return None
+
+
+def _text_digest(text: str) -> bytes:
+    """Stable content key for a text"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+def _keys_path(filepath: str) -> Path:
+    """Path of the text-digest index stored next to a cached embeddings file"""
+    path = Path(filepath)
+    return path.with_name(f"{path.stem}.keys.json")
+
+
+def _scale_path(filepath: str) -> Path:
+    """Path of the per-row int8 scales stored next to a quantized embeddings file"""
+    path = Path(filepath)
+    return path.with_name(f"{path.stem}.scale.npy")
+
 
 class EmbeddingsManager:
     """Manage text embeddings using sentence-transformers"""
     
-    def __init__(self, model_name: str = 'all-MiniLM-L6-v2'):
+    def __init__(self, model_name: str = 'all-MiniLM-L6-v2', cache_size: int = 1024):
         """
         Initialize embeddings manager
         
         Args:
             model_name: Name of the sentence-transformer model
+            cache_size: Number of embeddings to memoize by text (0 disables)
         """
         self.model_name = model_name
-        self.model = None
-        self._load_model()
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        
+        # The model is loaded on first use, so metrics-only callers never import torch
+        self._model = None
+        self._model_load_attempted = False
+    
+    @property
+    def model(self):
+        """Embedding model, loaded on first access (None if it can't be loaded)"""
+        if self._model is None and not self._model_load_attempted:
+            self._load_model()
+        return self._model
+    
+    @model.setter
+    def model(self, model):
+        self._model = model
+        self._model_load_attempted = True
+    
+    def warm(self) -> bool:
+        """
+        Load the model now instead of on first use
+        
+        Returns:
+            True if the model is available
+        """
+        return self.model is not None
     
     def _load_model(self):
         """Load the embedding model"""
+        self._model_load_attempted = True
         try:
             from sentence_transformers import SentenceTransformer
-            self.model = SentenceTransformer(self.model_name)
+            self._model = SentenceTransformer(self.model_name)
             logger.info(f"Loaded embedding model: {self.model_name}")
         except Exception as e:
             logger.warning(f"Could not load embedding model: {e}")
-            self.model = None
+            self._model = None
     
-    def encode(self, texts: List[str], batch_size: int = 32) -> Optional[np.ndarray]:
+    def encode(self, texts: List[str], batch_size: int = 32, normalize: bool = True) -> Optional[np.ndarray]:
         """
         Encode texts to embeddings
         
+        Texts already in the LRU cache are not re-encoded; the rest are
+        encoded together in a single model call, sorted by length when
+        they span several batches.
+        
         Args:
             texts: List of texts to encode
             batch_size: Batch size for encoding
+            normalize: Return L2-normalized embeddings, so cosine
+                similarity is a plain dot product
             
         Returns:
             Numpy array of embeddings or None if model not loaded
@@ -52,8 +139,40 @@ class EmbeddingsManager:
             if isinstance(texts, str):
                 texts = [texts]
             
-            embeddings = self.model.encode(texts, batch_size=batch_size, show_progress_bar=False)
-            return embeddings
+            keys = [(normalize, _text_digest(text)) for text in texts]
+            if not keys:
+                get_dim = getattr(self.model, 'get_sentence_embedding_dimension', None)
+                return np.empty((0, (get_dim() if get_dim else None) or 0), dtype=np.float32)
+            
+            # Hits are collected up front so evictions below cannot drop them
+            found = {}
+            missing = {}
+            for key, text in zip(keys, texts):
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    found[key] = self._cache[key]
+                else:
+                    missing.setdefault(key, text)
+            
+            if missing:
+                if len(missing) > batch_size:
+                    # Smart batching: similar-length texts share a batch, minimizing padding
+                    missing = dict(sorted(missing.items(), key=lambda item: len(item[1])))
+                embeddings = self.model.encode(
+                    list(missing.values()),
+                    batch_size=batch_size,
+                    normalize_embeddings=normalize,
+                    show_progress_bar=False
+                )
+                encoded = dict(zip(missing.keys(), embeddings))
+                found.update(encoded)
+                
+                if self.cache_size > 0:
+                    self._cache.update(encoded)
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+            
+            return np.stack([found[key] for key in keys])
         
         except Exception as e:
             logger.error(f"Error encoding texts: {e}")
@@ -74,16 +193,19 @@ class EmbeddingsManager:
             return 0.0
         
         try:
-            from sklearn.metrics.pairwise import cosine_similarity
-            
-            emb1 = self.encode([text1])
-            emb2 = self.encode([text2])
+            # Both texts go through the model in a single forward pass
+            embeddings = self.encode([text1, text2])
             
-            if emb1 is None or emb2 is None:
+            if embeddings is None:
                 return 0.0
             
-            similarity = cosine_similarity(emb1, emb2)[0][0]
-            return float(similarity)
+            a, b = np.ascontiguousarray(embeddings, dtype=np.float32)
+            if simsimd is not None:
+                # SIMD kernel returns cosine distance
+                return float(1.0 - simsimd.cosine(a, b))
+            
+            # Embeddings are unit-length, so cosine similarity is a dot product
+            return float(np.dot(a, b))
         
         except Exception as e:
             logger.error(f"Error calculating similarity: {e}")
@@ -104,39 +226,280 @@ class EmbeddingsManager:
             return [0.0] * len(candidates)
         
         try:
-            from sklearn.metrics.pairwise import cosine_similarity
+            if len(candidates) >= _GPU_MIN_CANDIDATES and _cuda_available():
+                return self._batch_similarity_cuda(query, candidates)
             
-            query_emb = self.encode([query])
-            candidate_embs = self.encode(candidates)
+            # Query and candidates go through the model in a single batch
+            embeddings = self.encode([query] + list(candidates))
             
-            if query_emb is None or candidate_embs is None:
+            if embeddings is None:
                 return [0.0] * len(candidates)
             
-            similarities = cosine_similarity(query_emb, candidate_embs)[0]
-            return similarities.tolist()
+            return self.batch_similarity_precomputed(embeddings[0], embeddings[1:]).tolist()
         
         except Exception as e:
             logger.error(f"Error calculating batch similarity: {e}")
             return [0.0] * len(candidates)
     
+    def encode_query(self, query: str) -> Optional[np.ndarray]:
+        """
+        Encode a single query for reuse across batch_similarity_precomputed calls
+        
+        Args:
+            query: Query text
+            
+        Returns:
+            L2-normalized vector of shape (dim,), or None if encoding fails
+        """
+        embeddings = self.encode([query])
+        return None if embeddings is None else embeddings[0]
+    
+    @staticmethod
+    def batch_similarity_precomputed(query_emb: np.ndarray, candidate_embs: np.ndarray,
+                                     normalized: bool = True) -> np.ndarray:
+        """
+        Calculate similarity between an already-encoded query and candidates
+        
+        Skips the model entirely, so a query encoded once with encode_query()
+        can be scored against many candidate pages.
+        
+        Args:
+            query_emb: Query vector of shape (dim,)
+            candidate_embs: Candidate matrix of shape (n, dim)
+            normalized: Whether the inputs are L2-normalized (as encode()
+                returns them); pass False to get true cosine similarity
+                for raw vectors
+            
+        Returns:
+            Float array of shape (n,) with the similarity scores
+        """
+        query_emb = np.ascontiguousarray(query_emb, dtype=np.float32).reshape(1, -1)
+        candidate_embs = np.ascontiguousarray(candidate_embs, dtype=np.float32)
+        
+        if len(candidate_embs) == 0:
+            return np.empty(0, dtype=np.float32)
+        
+        if simsimd is not None:
+            # SIMD kernel returns cosine distances, shape (1, n_candidates)
+            distances = simsimd.cdist(query_emb, candidate_embs, metric='cosine')
+            return 1.0 - np.asarray(distances).ravel()
+        
+        if normalized:
+            # Unit-length rows, so the matrix-vector product is the cosine
+            return candidate_embs @ query_emb[0]
+        
+        cos_matrix = _numba_cos_matrix() if len(candidate_embs) >= _NUMBA_MIN_CANDIDATES else None
+        if cos_matrix is not None:
+            # Fuses the norms into the dot products instead of extra passes
+            similarities = np.empty((1, len(candidate_embs)), dtype=np.float32)
+            cos_matrix(query_emb, candidate_embs, similarities)
+            return similarities[0]
+        
+        similarities = candidate_embs @ query_emb[0]
+        norms = np.linalg.norm(candidate_embs, axis=1) * np.linalg.norm(query_emb)
+        return np.divide(similarities, norms, out=np.zeros_like(similarities), where=norms > 0)
+    
+    def batch_top_k(self, query: str, candidates: List[str], k: int) -> List[Tuple[int, float]]:
+        """
+        Find the k candidates most similar to the query
+        
+        Scores every candidate with one matrix-vector product, then
+        selects the k best in O(n) and sorts only those.
+        
+        Args:
+            query: Query text
+            candidates: List of candidate texts
+            k: Number of results
+            
+        Returns:
+            (candidate index, similarity) pairs, most similar first (ties by index)
+        """
+        if self.model is None or k <= 0 or not candidates:
+            return []
+        
+        try:
+            embeddings = self.encode([query] + list(candidates))
+            
+            if embeddings is None:
+                return []
+            
+            similarities = self.batch_similarity_precomputed(embeddings[0], embeddings[1:])
+            num_candidates = len(similarities)
+            k = min(k, num_candidates)
+            
+            if k == num_candidates:
+                top_indices = np.arange(num_candidates)
+            else:
+                # Everything strictly above the k-th best score, then the
+                # earliest candidates tied with it
+                kth_score = similarities[np.argpartition(-similarities, k - 1)[k - 1]]
+                above = np.flatnonzero(similarities > kth_score)
+                ties = np.flatnonzero(similarities == kth_score)[:k - len(above)]
+                top_indices = np.concatenate([above, ties])
+            
+            order = top_indices[np.argsort(-similarities[top_indices], kind='stable')]
+            return [(int(i), float(similarities[i])) for i in order]
+        
+        except Exception as e:
+            logger.error(f"Error calculating top-k similarity: {e}")
+            return []
+    
+    def _batch_similarity_cuda(self, query: str, candidates: List[str]) -> List[float]:
+        """Encode and score on the GPU in FP16, copying only the final scores to the host"""
+        embeddings = self.model.encode(
+            [query] + list(candidates),
+            convert_to_tensor=True,
+            device='cuda',
+            normalize_embeddings=True,
+            show_progress_bar=False
+        ).half()
+        similarities = embeddings[1:] @ embeddings[0]
+        return similarities.float().cpu().numpy().tolist()
+    
     @staticmethod
-    def cache_embeddings(embeddings: np.ndarray, filepath: str):
-        """Cache embeddings to disk"""
+    def quantize_int8(embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Quantize embeddings to int8 with a per-row scale (4x smaller than float32)
+        
+        Cosine similarity is invariant to the per-row scale, so the int8
+        rows can be compared directly after casting to float.
+        
+        Args:
+            embeddings: Array of shape (n, dim)
+            
+        Returns:
+            Tuple of (int8 array of shape (n, dim), float32 scales of shape (n, 1))
+        """
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        scale = np.abs(embeddings).max(axis=1, keepdims=True) / 127.0
+        scale[scale == 0] = 1.0
+        quantized = np.round(embeddings / scale).astype(np.int8)
+        return quantized, scale
+    
+    @staticmethod
+    def dequantize_int8(quantized: np.ndarray, scale: np.ndarray) -> np.ndarray:
+        """Reconstruct float32 embeddings from int8 rows and their scales"""
+        return quantized.astype(np.float32) * scale
+    
+    @staticmethod
+    def cache_embeddings(embeddings: np.ndarray, filepath: str, texts: List[str] = None,
+                         quantize: bool = False, compress: bool = False):
+        """
+        Cache embeddings to disk as a raw .npy array
+        
+        Embeddings from encode() are L2-normalized by default, so ranking
+        a loaded cache against a query is a single matrix-vector product.
+        
+        Args:
+            embeddings: Array of shape (n, dim)
+            filepath: Path of the file to write
+            texts: Optional source texts (one per row); when given, a
+                digest-to-row index is written alongside for lookups
+            quantize: Store int8 rows plus per-row scales instead of float32
+            compress: Write a compressed archive (float16 unless quantized)
+                for cold storage; smaller on disk, but it must be
+                decompressed in full on load instead of memory-mapped
+            
+        Raises:
+            ValueError: If texts is given and does not have one entry per row
+        """
+        if texts is not None and len(texts) != len(embeddings):
+            raise ValueError(f"Got {len(texts)} texts for {len(embeddings)} embeddings")
+        
         try:
-            import joblib
-            joblib.dump(embeddings, filepath)
+            scale = None
+            if quantize:
+                rows, scale = EmbeddingsManager.quantize_int8(embeddings)
+            elif compress:
+                rows = np.asarray(embeddings, dtype=np.float16)
+            else:
+                rows = np.ascontiguousarray(embeddings, dtype=np.float32)
+            
+            # Write through a handle so numpy doesn't append a suffix
+            with open(filepath, 'wb') as f:
+                if compress:
+                    arrays = {'emb': rows} if scale is None else {'emb': rows, 'scale': scale}
+                    np.savez_compressed(f, **arrays)
+                else:
+                    np.save(f, rows)
+            
+            if scale is not None and not compress:
+                np.save(_scale_path(filepath), scale)
+            else:
+                _scale_path(filepath).unlink(missing_ok=True)
+            
+            if texts is not None:
+                index = {_text_digest(text).hex(): row for row, text in enumerate(texts)}
+                _keys_path(filepath).write_text(json.dumps(index), encoding='utf-8')
+            else:
+                # An index left from an earlier cache would point at the wrong rows
+                _keys_path(filepath).unlink(missing_ok=True)
+            
             logger.info(f"Cached embeddings to {filepath}")
         except Exception as e:
             logger.error(f"Error caching embeddings: {e}")
     
+    @staticmethod
+    def _read_cached_embeddings(filepath: str, rows: List[int] = None) -> np.ndarray:
+        """Read all (or the given) rows of any cache layout as float32"""
+        data = np.load(filepath, mmap_mode='r')
+        if isinstance(data, np.lib.npyio.NpzFile):
+            with data:
+                embeddings = data['emb']
+                scale = data['scale'] if 'scale' in data.files else None
+        else:
+            embeddings = data
+            scale_path = _scale_path(filepath)
+            scale = np.load(scale_path) if scale_path.exists() else None
+        
+        if rows is not None:
+            # Fancy indexing a memmap reads only the touched pages
+            embeddings = np.asarray(embeddings[rows])
+            scale = scale[rows] if scale is not None else None
+        
+        if scale is not None:
+            return EmbeddingsManager.dequantize_int8(embeddings, scale)
+        if embeddings.dtype != np.float32:
+            return embeddings.astype(np.float32)
+        return embeddings
+    
     @staticmethod
     def load_cached_embeddings(filepath: str) -> Optional[np.ndarray]:
-        """Load cached embeddings from disk"""
+        """
+        Load cached embeddings from disk as a read-only memory map
+        
+        Rows are paged in by the OS only when accessed, so opening a
+        large cache is effectively free. Quantized and compressed caches
+        are read in full and returned as float32.
+        """
         try:
-            import joblib
-            embeddings = joblib.load(filepath)
+            embeddings = EmbeddingsManager._read_cached_embeddings(filepath)
             logger.info(f"Loaded cached embeddings from {filepath}")
             return embeddings
         except Exception as e:
             logger.error(f"Error loading cached embeddings: {e}")
             return None
+    
+    @staticmethod
+    def lookup_cached_embeddings(filepath: str, texts: List[str]) -> Optional[np.ndarray]:
+        """
+        Fetch the cached embeddings of specific texts
+        
+        Args:
+            filepath: Path of a cache written with texts
+            texts: Texts to look up
+            
+        Returns:
+            Array of shape (len(texts), dim), or None if the cache is
+            unreadable or any text is missing from it
+        """
+        try:
+            index = json.loads(_keys_path(filepath).read_text(encoding='utf-8'))
+            rows = [index.get(_text_digest(text).hex()) for text in texts]
+            if None in rows:
+                return None
+            
+            return EmbeddingsManager._read_cached_embeddings(filepath, rows)
+        except Exception as e:
+            logger.error(f"Error looking up cached embeddings: {e}")
+            return None
@@ -0,0 +1,42 @@
+"""
+Numba Embedding Kernels
+JIT-compiled cosine similarity for environments without SimSIMD
+"""
+import math
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def cos_matrix(A: np.ndarray, B: np.ndarray, out: np.ndarray):
+    """
+    Fill out[i, j] with the cosine similarity of A[i] and B[j]
+    
+    Args:
+        A: C-contiguous float32 array of shape (n, dim)
+        B: C-contiguous float32 array of shape (m, dim)
+        out: Preallocated float32 array of shape (n, m)
+    """
+    n, dim = A.shape
+    m = B.shape[0]
+    
+    a_norms = np.empty(n, dtype=np.float32)
+    for i in prange(n):
+        acc = 0.0
+        for k in range(dim):
+            acc += A[i, k] * A[i, k]
+        a_norms[i] = math.sqrt(acc)
+    
+    # Parallelize over candidates: the usual call is one query row against many
+    for j in prange(m):
+        b_norm = 0.0
+        for k in range(dim):
+            b_norm += B[j, k] * B[j, k]
+        b_norm = math.sqrt(b_norm)
+        
+        for i in range(n):
+            dot = 0.0
+            for k in range(dim):
+                dot += A[i, k] * B[j, k]
+            denom = a_norms[i] * b_norm
+            out[i, j] = dot / denom if denom > 0.0 else 0.0
@@ -2,12 +2,73 @@
 Metrics Utility
 Calculate various metrics for resume analysis
 """
-from typing import Dict, List
+import functools
+import re
+from collections import Counter
+from typing import Dict, List, Tuple
 import logging
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 
+def _is_word_char(char: str) -> bool:
+    """Match the regex \\w class for a single character"""
+    return char.isalnum() or char == '_'
+
+
+@functools.lru_cache(maxsize=32)
+def _keyword_pattern(keywords_lower: Tuple[str, ...]) -> re.Pattern:
+    """Compile (once per keyword set) a whole-word alternation of the keywords"""
+    # Lookarounds (not \b) so keywords like 'c++' still match
+    return re.compile(r'(?<!\w)(?:' + '|'.join(map(re.escape, keywords_lower)) + r')(?!\w)')
+
+
+@functools.lru_cache(maxsize=32)
+def _keyword_automaton(keywords_lower: Tuple[str, ...]):
+    """Build (once per keyword set) an Aho-Corasick automaton of the keywords"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords_lower:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def _count_keywords_regex(text_lower: str, keywords_lower: Tuple[str, ...]) -> Counter:
+    """Count whole-word keyword matches with a single alternation scan (fallback without pyahocorasick)"""
+    return Counter(_keyword_pattern(keywords_lower).findall(text_lower))
+
+
+def _count_keywords_automaton(text_lower: str, keywords_lower: Tuple[str, ...]) -> Counter:
+    """Count whole-word keyword matches with an Aho-Corasick scan (same semantics as the regex)"""
+    automaton = _keyword_automaton(keywords_lower)
+    
+    # Keep whole-word matches, ordered leftmost then longest
+    matches = []
+    text_len = len(text_lower)
+    for end, keyword in automaton.iter(text_lower):
+        start = end - len(keyword) + 1
+        if start > 0 and _is_word_char(text_lower[start - 1]):
+            continue
+        if end + 1 < text_len and _is_word_char(text_lower[end + 1]):
+            continue
+        matches.append((start, -len(keyword), keyword))
+    matches.sort()
+    
+    # Non-overlapping sweep, as the regex engine would consume them
+    counts = Counter()
+    position = 0
+    for start, neg_length, keyword in matches:
+        if start >= position:
+            counts[keyword] += 1
+            position = start - neg_length
+    return counts
+
+
 class MetricsCalculator:
     """Calculate metrics for resume analysis"""
     
@@ -22,42 +83,36 @@ class MetricsCalculator:
         Returns:
             Completeness score
         """
-        score = 0
-        max_score = 100
-        
-        # Essential sections (60 points)
-        if resume_data.get('contact', {}).get('email'):
-            score += 10
-        if resume_data.get('contact', {}).get('phone'):
-            score += 10
-        if resume_data.get('skills', {}).get('technical_skills'):
-            score += 15
-        if resume_data.get('experience'):
-            score += 15
-        if resume_data.get('education'):
-            score += 10
-        
-        # Optional sections (40 points)
-        if resume_data.get('projects'):
-            score += 10
-        if resume_data.get('certifications'):
-            score += 10
-        if resume_data.get('contact', {}).get('linkedin'):
-            score += 5
-        if resume_data.get('contact', {}).get('github'):
-            score += 5
-        if resume_data.get('contact', {}).get('location'):
-            score += 5
-        if len(resume_data.get('skills', {}).get('soft_skills', [])) > 0:
-            score += 5
-        
-        return min(max_score, score)
+        contact = resume_data.get('contact') or {}
+        skills = resume_data.get('skills') or {}
+        
+        fields = (
+            # Essential sections (60 points)
+            (10, contact.get('email')),
+            (10, contact.get('phone')),
+            (15, skills.get('technical_skills')),
+            (15, resume_data.get('experience')),
+            (10, resume_data.get('education')),
+            # Optional sections (40 points)
+            (10, resume_data.get('projects')),
+            (10, resume_data.get('certifications')),
+            (5, contact.get('linkedin')),
+            (5, contact.get('github')),
+            (5, contact.get('location')),
+            (5, skills.get('soft_skills'))
+        )
+        
+        return min(100, sum(weight for weight, value in fields if value))
     
     @staticmethod
     def calculate_keyword_density(text: str, keywords: List[str]) -> Dict[str, float]:
         """
         Calculate keyword density for given keywords
         
+        Keywords are matched case-insensitively as whole words in one
+        pass over the text; when keywords overlap, the longest wins. Unlike
+        a plain substring count, 'java' does not match inside 'javascript'.
+        
         Args:
             text: Text to analyze
             keywords: List of keywords
@@ -66,18 +121,23 @@ class MetricsCalculator:
             Dictionary mapping keywords to their density
         """
         text_lower = text.lower()
-        words = text_lower.split()
-        total_words = len(words)
+        total_words = len(text_lower.split())
         
         if total_words == 0:
             return {kw: 0.0 for kw in keywords}
         
-        density = {}
-        for keyword in keywords:
-            count = text_lower.count(keyword.lower())
-            density[keyword] = (count / total_words) * 100
+        # Longest first (alternation order), ties alphabetical so equal sets share a cache entry
+        keywords_lower = tuple(sorted({kw.lower() for kw in keywords if kw}, key=lambda kw: (-len(kw), kw)))
+        if not keywords_lower:
+            return {kw: 0.0 for kw in keywords}
+        
+        # Automata are memoized per keyword set, so they beat the regex at any size
+        if ahocorasick is not None:
+            counts = _count_keywords_automaton(text_lower, keywords_lower)
+        else:
+            counts = _count_keywords_regex(text_lower, keywords_lower)
         
-        return density
+        return {kw: (counts[kw.lower()] / total_words) * 100 for kw in keywords}
     
     @staticmethod
     def calculate_readability_score(text: str) -> float:
@@ -90,13 +150,14 @@ class MetricsCalculator:
         Returns:
             Readability score (0-100, higher is more readable)
         """
-        sentences = text.split('.')
-        words = text.split()
+        # Only counts are needed: '.'-separated segments without building the list
+        num_sentences = text.count('.') + 1
+        num_words = len(text.split())
         
-        if len(sentences) == 0 or len(words) == 0:
+        if num_words == 0:
             return 50.0
         
-        avg_sentence_length = len(words) / len(sentences)
+        avg_sentence_length = num_words / num_sentences
         
         # Ideal sentence length is 15-20 words
         if 15 <= avg_sentence_length <= 20:
@@ -122,25 +183,19 @@ class MetricsCalculator:
         if not experiences:
             return 0.0
         
-        score = 0
-        
-        # Total years of experience
-        total_years = sum(exp.get('duration_years', 0) for exp in experiences)
-        score += min(50, total_years * 10)  # Max 50 points for 5+ years
-        
-        # Number of positions
-        score += min(25, len(experiences) * 8)  # Max 25 points for 3+ positions
-        
-        # Description quality
+        # Single pass: total years and description quality
+        total_years = 0
+        description_bonus = 0
         for exp in experiences:
-            desc = exp.get('description', '')
-            if len(desc) > 100:
-                score += 5
-            if len(desc) > 200:
-                score += 5
-        
-        score = min(15, score - 50)  # Max 15 points for descriptions
-        score += 50  # Add back the base score
+            total_years += exp.get('duration_years', 0) or 0
+            desc_len = len(exp.get('description', '') or '')
+            description_bonus += 5 * ((desc_len > 100) + (desc_len > 200))
+        
+        score = (
+            min(50, total_years * 10) +         # Max 50 points for 5+ years
+            min(25, len(experiences) * 8) +     # Max 25 points for 3+ positions
+            min(15, description_bonus)          # Max 15 points for descriptions
+        )
         
         return min(100, score)
     
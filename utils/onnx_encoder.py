@@ -0,0 +1,107 @@
+"""
+ONNX Encoder Utility
+CPU sentence embeddings with ONNX Runtime, without a PyTorch dependency
+"""
+import numpy as np
+import os
+from pathlib import Path
+from typing import List, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def mean_pool(last_hidden_state: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+    """
+    Average token embeddings, ignoring padding
+
+    Args:
+        last_hidden_state: Token embeddings of shape (batch, tokens, dim)
+        attention_mask: Mask of shape (batch, tokens), 1 for real tokens
+
+    Returns:
+        Sentence embeddings of shape (batch, dim)
+    """
+    mask = attention_mask[..., np.newaxis].astype(last_hidden_state.dtype)
+    summed = (last_hidden_state * mask).sum(axis=1)
+    counts = np.clip(mask.sum(axis=1), 1e-9, None)
+    return summed / counts
+
+
+class ONNXSentenceEncoder:
+    """
+    Drop-in replacement for SentenceTransformer.encode backed by ONNX Runtime
+
+    Expects a directory produced by:
+        optimum-cli export onnx --model sentence-transformers/all-MiniLM-L6-v2 \
+            --task feature-extraction models/all-MiniLM-L6-v2-onnx/
+    """
+
+    def __init__(self, model_dir: str, max_seq_length: int = 256, num_threads: int = None):
+        """
+        Initialize ONNX encoder
+
+        Args:
+            model_dir: Directory containing model.onnx and tokenizer files
+            max_seq_length: Maximum tokens per text (MiniLM was trained with 256)
+            num_threads: Intra-op threads (defaults to min(8, CPU count))
+        """
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        model_dir = Path(model_dir)
+        model_path = model_dir / 'model.onnx'
+        if not model_path.exists():
+            raise FileNotFoundError(f"ONNX model not found: {model_path}")
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = num_threads or min(8, os.cpu_count() or 1)
+
+        self.session = ort.InferenceSession(
+            str(model_path), sess_options=options, providers=['CPUExecutionProvider']
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(str(model_dir))
+        self.max_seq_length = max_seq_length
+        self.input_names = {inp.name for inp in self.session.get_inputs()}
+
+        logger.info(f"Loaded ONNX embedding model: {model_path}")
+
+    def encode(self, sentences: Union[str, List[str]], batch_size: int = 32,
+               convert_to_numpy: bool = True, normalize_embeddings: bool = False,
+               show_progress_bar: bool = False) -> np.ndarray:
+        """
+        Encode texts to embeddings
+
+        Args:
+            sentences: Text or list of texts
+            batch_size: Number of texts per inference call
+            convert_to_numpy: Accepted for API compatibility (always numpy)
+            normalize_embeddings: L2-normalize the output embeddings
+            show_progress_bar: Accepted for API compatibility (ignored)
+
+        Returns:
+            Embedding vector for a single text, otherwise array of shape (n, dim)
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+
+        batches = []
+        for start in range(0, len(texts), batch_size):
+            tokens = self.tokenizer(
+                texts[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors='np'
+            )
+            feeds = {name: tokens[name].astype(np.int64) for name in self.input_names if name in tokens}
+            last_hidden_state = self.session.run(None, feeds)[0]
+            batches.append(mean_pool(last_hidden_state, tokens['attention_mask']))
+
+        embeddings = np.concatenate(batches) if batches else np.zeros((0, 0), dtype=np.float32)
+
+        if normalize_embeddings and len(embeddings):
+            embeddings = embeddings / np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+
+        return embeddings[0] if single else embeddings